@@ -447,29 +447,9 @@ class UpsertFieldTool(BaseTool):
                 entities = {e.field: e for e in list_entities(session.category_id)}
             else:
                 entities = {}
-            entity = entities.get(field)
-
-            # Доступ до умов договору (contract fields)
-            if entity is not None:
-                if not can_edit_contract_field(session, acting_user_id=user_id, field_name=field):
-                    return {
-                        "ok": False,
-                        "error": "Вам не дозволено редагувати це поле договору.",
-                        "status_code": 403,
-                    }
-            elif session.category_id:
-                # It is a party field
-                effective_role = role_arg or session.role
-                if effective_role:
-                    can_edit = can_edit_party_field(
-                        session, acting_user_id=user_id, target_role=effective_role
-                    )
-                    if not can_edit:
-                        return {
-                            "ok": False,
-                            "error": f"Ви не маєте права редагувати поля ролі '{effective_role}'.",
-                            "status_code": 403,
-                        }
+            denied = self._access_error(session, user_id, field, role_arg, entities)
+            if denied:
+                return denied
 
             from backend.domain.services.session import update_session_field  # pylint: disable=import-outside-toplevel
 
@@ -500,6 +480,34 @@ class UpsertFieldTool(BaseTool):
                 "state": session.state.value,
             }
 
+    @staticmethod
+    def _access_error(
+        session, user_id: str, field: str, role_arg: str | None, entities: Dict[str, Any]
+    ) -> Dict[str, Any] | None:
+        """Return the 403 payload if user_id may not edit this field, else None."""
+        # Доступ до умов договору (contract fields)
+        if field in entities:
+            if not can_edit_contract_field(session, acting_user_id=user_id, field_name=field):
+                return {
+                    "ok": False,
+                    "error": "Вам не дозволено редагувати це поле договору.",
+                    "status_code": 403,
+                }
+        elif session.category_id:
+            # It is a party field
+            effective_role = role_arg or session.role
+            if effective_role:
+                can_edit = can_edit_party_field(
+                    session, acting_user_id=user_id, target_role=effective_role
+                )
+                if not can_edit:
+                    return {
+                        "ok": False,
+                        "error": f"Ви не маєте права редагувати поля ролі '{effective_role}'.",
+                        "status_code": 403,
+                    }
+        return None
+
     def _unmask_value(self, value: str, tags: Dict[str, str] | None) -> str:
         if not tags:
             return value
@@ -509,6 +517,97 @@ class UpsertFieldTool(BaseTool):
                 result = result.replace(tag, raw)
         return result
 
+
+@register_tool
+class UpsertFieldsBatchTool(UpsertFieldTool):
+    """Tool to update several field values in one session transaction."""
+
+    @property
+    def name(self) -> str:
+        return "upsert_fields"
+
+    @property
+    def description(self) -> str:
+        return "Update several field values at once (one save). Handles PII tags [TYPE#N]."
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "minLength": 1,
+                },
+                "updates": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "role": {"type": "string", "minLength": 1},
+                            "field": {"type": "string", "minLength": 1},
+                            "value": {"type": "string", "minLength": 1},
+                        },
+                        "required": ["field", "value"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["session_id", "updates"],
+            "additionalProperties": False,
+        }
+
+    async def execute(self, args: Dict[str, Any], context: Dict[str, Any]) -> Any:
+        session_id = args["session_id"]
+        updates = args["updates"]
+        tags = context.get("pii_tags") or context.get("tags")
+
+        async with atransactional_session(session_id) as session:
+            user_id = context.get("user_id") or args.get("user_id")
+            if not user_id:
+                return {"ok": False, "error": "Необхідний заголовок X-User-ID."}
+
+            if session.category_id:
+                entities = {e.field: e for e in list_entities(session.category_id)}
+            else:
+                entities = {}
+            # Перевіряємо доступ до всіх полів до першого запису: пакет або весь, або нічого
+            for upd in updates:
+                denied = self._access_error(
+                    session, user_id, upd["field"], upd.get("role"), entities
+                )
+                if denied:
+                    return {**denied, "field": upd["field"], "role": upd.get("role")}
+
+            from backend.domain.services.session import update_session_fields  # pylint: disable=import-outside-toplevel
+
+            results = update_session_fields(
+                session,
+                [
+                    (upd.get("role"), upd["field"], self._unmask_value(upd["value"], tags))
+                    for upd in updates
+                ],
+                tags=tags,
+                context={**context, "user_id": user_id},
+            )
+
+            return {
+                "ok": all(ok for ok, _, _ in results),
+                "results": [
+                    {
+                        "field": upd["field"],
+                        "role": upd.get("role"),
+                        "ok": ok,
+                        "error": error,
+                        "status": fs.status,
+                    }
+                    for upd, (ok, error, fs) in zip(updates, results)
+                ],
+                "can_build_contract": session.can_build_contract,
+                "state": session.state.value,
+            }
+
 @register_tool
 class GetSessionSummaryTool(BaseTool):
     """Tool to get session field status summary."""
@@ -436,6 +436,7 @@ SESSION_AWARE_TOOLS = {
     "set_template",
     "set_party_context",
     "upsert_field",
+    "upsert_fields",
     "get_session_summary",
     "build_contract",
     "route_message",
@@ -454,6 +455,7 @@ TOOL_ALIAS_BY_CANON: Dict[str, str] = {
     "set_party_context": "pc",
     "get_party_fields_for_session": "pf",
     "upsert_field": "uf",
+    "upsert_fields": "ufs",
     "get_session_summary": "gs",
     "build_contract": "bc",
     "route_message": "rt",
@@ -502,6 +504,7 @@ ALLOWED_TOOLS_BY_STATE: Dict[str, List[str]] = {
         "get_party_fields_for_session",
         "set_party_context",
         "upsert_field",
+        "upsert_fields",
         "get_session_summary",
         "set_template",
         "set_filling_mode",
@@ -513,6 +516,7 @@ ALLOWED_TOOLS_BY_STATE: Dict[str, List[str]] = {
         "get_party_fields_for_session",
         "set_party_context",
         "upsert_field",
+        "upsert_fields",
         "get_session_summary",
         "set_filling_mode",
     ],
@@ -522,6 +526,7 @@ ALLOWED_TOOLS_BY_STATE: Dict[str, List[str]] = {
         # Allow editing (will invalidate signatures if any)
         "set_party_context",
         "upsert_field",
+        "upsert_fields",
         "set_filling_mode",
     ],
     "built": [
@@ -530,6 +535,7 @@ ALLOWED_TOOLS_BY_STATE: Dict[str, List[str]] = {
         # Allow editing (will invalidate signatures if any and reset state to ready/collecting)
         "set_party_context",
         "upsert_field",
+        "upsert_fields",
         "set_filling_mode",
         "sign_contract",
     ],
@@ -2088,6 +2094,7 @@ class SyncSessionRequest(BaseModel):
     category_id: Optional[str] = None
     template_id: Optional[str] = None
     parties: Dict[str, PartyData]
+    contract_fields: Dict[str, str] = {}
 
 
 @app.post("/sessions/{session_id}/sync")
@@ -2118,6 +2125,8 @@ async def sync_session(
     is_ready = True
     template_id_local: Optional[str] = None
     role_owners: Dict[str, str] = {}
+    contract_errors: Dict[str, str] = {}
+    saved_contract_fields: Dict[str, str] = {}
 
     async with atransactional_session(session_id) as session:
         # 2. Set Category / Template if provided
@@ -2154,7 +2163,7 @@ async def sync_session(
 
         # Import service
         # pylint: disable=import-outside-toplevel
-        from backend.domain.services.session import update_session_field
+        from backend.domain.services.session import update_session_field, update_session_fields
 
         # 3. Process Parties
         for role_id, party_data in req.parties.items():
@@ -2187,6 +2196,25 @@ async def sync_session(
                         field_errors[role_id] = {}
                     field_errors[role_id][field_name] = error
 
+        # 3b. Contract fields in the same transaction (замість окремого POST на кожне поле)
+        if req.contract_fields:
+            entity_names = {e.field for e in list_entities(session.category_id)}
+            unknown = [f for f in req.contract_fields if f not in entity_names]
+            if unknown:
+                raise HTTPException(
+                    status_code=400, detail=f"Unknown contract field(s): {', '.join(unknown)}"
+                )
+            results = update_session_fields(
+                session,
+                [(None, field_name, value) for field_name, value in req.contract_fields.items()],
+                context={"user_id": user_id, "source": "api"},
+            )
+            for field_name, (ok, error, _fs) in zip(req.contract_fields, results):
+                if ok:
+                    saved_contract_fields[field_name] = req.contract_fields[field_name]
+                elif error:
+                    contract_errors[field_name] = error
+
         # 4. Check Readiness using shared schema helper
         from backend.domain.services.fields import get_required_fields  # pylint: disable=import-outside-toplevel
         
@@ -2232,6 +2260,20 @@ async def sync_session(
 
     # End of transaction block. Session is saved to disk.
 
+    # Як і POST /fields: повідомляємо інших учасників про збережені поля договору
+    for field_name, value in saved_contract_fields.items():
+        await stream_manager.broadcast(
+            session_id,
+            {
+                "type": "field_update",
+                "field": field_name,
+                "field_key": field_name,
+                "value": value,
+                "role": None,
+            },
+            exclude_user_id=user_id,
+        )
+
     # Фільтрація списку missing під роль поточного клієнта
     if user_id and role_owners:
         current_role = next((r for r, uid in role_owners.items() if uid == user_id), None)
@@ -2255,6 +2297,7 @@ async def sync_session(
                 "contract": missing_contract,
                 "roles": missing_roles,
             },
+            "contract_errors": contract_errors,
             "session_id": session_id
         }
         if document_url:
@@ -2267,6 +2310,7 @@ async def sync_session(
             "contract": missing_contract,
             "roles": missing_roles,
         },
+        "contract_errors": contract_errors,
         "session_id": session_id
     }
 
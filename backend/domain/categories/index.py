@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from backend.infra.config.settings import settings
 from backend.shared.logging import get_logger
@@ -72,6 +72,20 @@ class PartyField:
 _CATEGORIES_PATH: Path | None = None
 _TEMPLATES_DIR: Path | None = None
 
+# Bumped whenever category data or metadata caches are reset, so caches built
+# on top of this module (e.g. required-field schemas) know to drop entries
+_meta_revision = 0  # pylint: disable=invalid-name
+
+
+def _bump_meta_revision() -> None:
+    global _meta_revision  # pylint: disable=global-statement
+    _meta_revision += 1
+
+
+def meta_revision() -> int:
+    """Return the current revision of category metadata."""
+    return _meta_revision
+
 
 def _categories_path() -> Path:
     """Return path to index.json (main categories file)."""
@@ -95,6 +109,7 @@ class CategoryStore:
 
     def load(self) -> None:
         """Load categories from index file."""
+        _bump_meta_revision()
         path = _categories_path()
         if not path.exists():
             logger.warning("Categories index not found at %s", path)
@@ -123,6 +138,7 @@ class CategoryStore:
     def clear(self) -> None:
         """Clear internal cache. Useful for testing."""
         self._categories = {}
+        _bump_meta_revision()
 
 
 class TemplateStore:
@@ -270,13 +286,21 @@ def load_meta(category: Category, use_cache: bool = True) -> dict:
     return data
 
 
+# Parsed party fields, keyed by (category_id, person_type, template_id); follows _meta_cache
+_party_fields_cache: Dict[Tuple[str, str, Optional[str]], Tuple[PartyField, ...]] = {}
+
+
 def clear_meta_cache(category_id: Optional[str] = None) -> None:
     """Clear metadata cache."""
+    _bump_meta_revision()
     if category_id:
         _meta_cache.pop(category_id, None)
+        for key in [k for k in _party_fields_cache if k[0] == category_id]:
+            del _party_fields_cache[key]
     else:
         _meta_cache.clear()
         _template_meta_cache.clear()
+        _party_fields_cache.clear()
 
 
 # Backward compatibility alias
@@ -371,28 +395,32 @@ def list_party_fields(category_id: str, person_type: str, template_id: Optional[
         person_type: Person type (individual/fop/company)
         template_id: Template ID (preferred, if provided)
     """
-    if template_id:
-        data = load_template_meta(template_id)
-    else:
+    category = None
+    if not template_id:
         category = store.get(category_id)
         if not category:
             raise ValueError(f"Unknown category_id: {category_id}")
-        data = load_meta(category)
-    
+
+    cache_key = (category_id, person_type, template_id)
+    cached = _party_fields_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    data = load_template_meta(template_id) if template_id else load_meta(category)
     modules = data.get("party_modules") or {}
     module = modules.get(person_type)
     if not module:
         return []
-    fields: List[PartyField] = []
-    for raw in module.get("fields", []):
-        fields.append(
-            PartyField(
-                field=raw["field"],
-                label=raw.get("label", raw["field"]),
-                required=bool(raw.get("required", True)),
-            )
+    fields = tuple(
+        PartyField(
+            field=raw["field"],
+            label=raw.get("label", raw["field"]),
+            required=bool(raw.get("required", True)),
         )
-    return fields
+        for raw in module.get("fields", [])
+    )
+    _party_fields_cache[cache_key] = fields
+    return list(fields)
 
 
 def get_party_schema(category_id: str, template_id: Optional[str] = None) -> Dict[str, Any]:
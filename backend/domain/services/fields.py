@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from typing import TYPE_CHECKING
 
@@ -11,6 +11,7 @@ from backend.domain.categories.index import (
     list_entities,
     list_party_fields,
     load_meta,
+    meta_revision,
     store as cat_store,
 )
 from backend.domain.sessions.models import Session
@@ -73,7 +74,7 @@ def get_party_fields_for_role(
     return party_fields_list
 
 
-@dataclass
+@dataclass(frozen=True)
 class FieldSchema:
     """Schema for a field in a session (contract or party field)."""
 
@@ -85,6 +86,27 @@ class FieldSchema:
     ai_required: bool = False
     type: str = "text"
 
+
+# Required-field schemas keyed by the session attributes they depend on, stored
+# with the meta_revision() they were built from. Dropped as a whole when category
+# metadata is reloaded; the per-entry revision also rejects a schema that a
+# concurrent caller finished building from pre-reload metadata.
+_required_fields_cache: Dict[Tuple[Any, ...], Tuple[int, Tuple[FieldSchema, ...]]] = {}
+_required_fields_rev = -1  # pylint: disable=invalid-name
+
+
+def _required_fields_key(session: Session, scope: str) -> Tuple[Any, ...]:
+    return (
+        session.category_id,
+        session.template_id,
+        scope,
+        session.filling_mode,
+        session.role,
+        session.person_type,
+        tuple(sorted((session.party_types or {}).items())),
+    )
+
+
 def get_required_fields(
     session: Session,
     scope: Literal["self", "all"] = "self"
@@ -109,6 +131,16 @@ def get_required_fields(
     if session.template_id and session.template_id.startswith("dynamic_"):
         raise ValueError("Dynamic templates are no longer supported")
 
+    global _required_fields_rev  # pylint: disable=global-statement
+    rev = meta_revision()
+    if rev != _required_fields_rev:
+        _required_fields_cache.clear()
+        _required_fields_rev = rev
+    cache_key = _required_fields_key(session, scope)
+    cached = _required_fields_cache.get(cache_key)
+    if cached is not None and cached[0] == rev:
+        return list(cached[1])
+
     # 1. Contract Fields
     entities = list_entities(session.category_id)
 
@@ -159,6 +191,7 @@ def get_required_fields(
                     type="text",
                 ))
 
+    _required_fields_cache[cache_key] = (rev, tuple(result))
     return result
 
 def validate_session_readiness(session: Session) -> bool:
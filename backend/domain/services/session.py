@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from backend.domain.categories.index import (
     list_entities,
@@ -292,17 +292,9 @@ def update_session_field(
     # So 'key' variable above is correct.
     session.all_data = all_data
 
-    # 5. Recalculate Session State (skip in lightweight mode for faster response)
+    # 5-6. Recalculate Session State and Progress (skip in lightweight mode for faster response)
     if not lightweight:
-        is_ready = validate_session_readiness(session)
-        session.can_build_contract = is_ready
-        if is_ready:
-            session.state = SessionState.READY_TO_BUILD
-        else:
-            session.state = SessionState.COLLECTING_FIELDS
-
-        # 6. Update Progress
-        _update_progress(session)
+        _refresh_readiness(session)
 
     # 7. Invalidate Signatures of OTHER parties
     if ok:
@@ -326,6 +318,42 @@ def update_session_field(
     return ok, error, fs
 
 
+def update_session_fields(
+    session: Session,
+    updates: Iterable[Tuple[Optional[str], str, str]],
+    tags: Optional[Dict[str, str]] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> List[Tuple[bool, Optional[str], FieldState]]:
+    """Apply many (role, field, value) updates with a single readiness/progress pass.
+
+    Each update is validated and recorded exactly like update_session_field;
+    only the session state and progress recalculation is deferred to the end.
+
+    Returns:
+        One (success, error_message, field_state) tuple per update, in order.
+    """
+    ctx = {**(context or {}), "lightweight": True}
+    history_len = len(session.history)
+    results = [
+        update_session_field(session, field, value, role=role, tags=tags, context=ctx)
+        for role, field, value in updates
+    ]
+    # Like the single-field path: refresh only if some update got past the early rejections
+    if len(session.history) != history_len and not (context or {}).get("lightweight", False):
+        _refresh_readiness(session)
+    return results
+
+
+def _refresh_readiness(session: Session) -> None:
+    is_ready = validate_session_readiness(session)
+    session.can_build_contract = is_ready
+    if is_ready:
+        session.state = SessionState.READY_TO_BUILD
+    else:
+        session.state = SessionState.COLLECTING_FIELDS
+    _update_progress(session)
+
+
 def _update_progress(session: Session) -> None:
     required = get_required_fields(session)
     total_req = len(required)
@@ -19,20 +19,27 @@ class SessionState(str, Enum):
     COMPLETED = "completed"          # Документ підписано обома сторонами
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldState:
-    """Status of an individual field in session (without PII value)."""
+    """
+    Status of an individual field in session (without PII value).
+
+    One instance exists per field per session, so it uses __slots__ instead
+    of a per-instance __dict__.
+    """
     status: str = "empty"  # empty | ok | error
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """
     Contract session containing all data and state for document filling.
 
     This dataclass holds all session-related information including user context,
     selected category/template, field states, signatures, and history.
+    Slotted: no per-instance __dict__, and a typo in an attribute name
+    raises instead of silently adding a field that is never persisted.
     """
     session_id: str
     creator_user_id: Optional[str] = None
@@ -5,6 +5,9 @@ import re
 
 from backend.shared.errors import ValidationError
 
+WHITESPACE_RE = re.compile(r"\s+")
+IBAN_CHARS_RE = re.compile(r"[A-Z0-9]+")
+
 
 def _mod97(iban: str) -> bool:
     """
@@ -30,14 +33,14 @@ def normalize_iban_ua(value: str) -> str:
     
     Returns empty string if value is empty (for optional fields).
     """
-    cleaned = re.sub(r"\s+", "", value).upper()
+    cleaned = WHITESPACE_RE.sub("", value).upper()
     if not cleaned:
         return ""  # Allow empty for optional fields
     if not cleaned.startswith("UA"):
         raise ValidationError("IBAN має починатися з 'UA'")
     if len(cleaned) != 29:
         raise ValidationError("IBAN в Україні має містити 29 символів")
-    if not re.fullmatch(r"[A-Z0-9]+", cleaned):
+    if not IBAN_CHARS_RE.fullmatch(cleaned):
         raise ValidationError("IBAN може містити лише латинські літери та цифри")
     if not _mod97(cleaned):
         raise ValidationError("IBAN не пройшов перевірку за MOD-97, перевірте номер")
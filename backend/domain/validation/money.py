@@ -6,6 +6,8 @@ from decimal import Decimal, InvalidOperation
 
 from backend.shared.errors import ValidationError
 
+MONEY_RE = re.compile(r"\d+(\.\d{1,2})?")
+
 
 def normalize_money(value: str) -> str:
     """
@@ -15,7 +17,7 @@ def normalize_money(value: str) -> str:
     # Replace comma with dot for decimals
     cleaned = cleaned.replace(",", ".")
     # Keep only digits and dot
-    if not re.fullmatch(r"\d+(\.\d{1,2})?", cleaned):
+    if not MONEY_RE.fullmatch(cleaned):
         raise ValidationError("Сума має бути числом, наприклад 15000 або 15000.00")
 
     try:
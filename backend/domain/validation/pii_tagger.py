@@ -43,7 +43,9 @@ CONFUSABLES = str.maketrans(
 # Символи-шум, які оточують значення (пробіли, дефіси тощо)
 NOISE = set(" \t\r\n-–—_.,:;·•()/\\[]{}<>|`'\"+*")
 
-EMAIL_RE = re.compile(r"[A-Za-z0-9_.%+-]+@[A-Za-z0-9-]+\.[A-Za-z0-9.-]+")
+# Локальна частина обмежена 64 символами (межа RFC 5321): без межі кожна
+# позиція довгого рядка без домену перечитує його до "@" — квадратичний час
+EMAIL_RE = re.compile(r"[A-Za-z0-9_.%+-]{1,64}@[A-Za-z0-9-]+\.[A-Za-z0-9.-]+")
 PHONE_RE = re.compile(
     r"(?:^|(?<=\D))(?:\+?38\s*\(?0\d{2}\)?[\s\-\.]*\d{3}[\s\-\.]*\d{2}[\s\-\.]*\d{2}"
     r"|0\d{2}[\s\-\.]*\d{3}[\s\-\.]*\d{2}[\s\-\.]*\d{2})(?=\D|$)"
@@ -55,6 +57,47 @@ PKEY_RE = re.compile(
     r"-----BEGIN [A-Z ]*PRIVATE KEY-----.*?-----END [A-Z ]*PRIVATE KEY-----", re.S
 )
 
+# Шаблони для канонізованого тексту (верхній регістр, без шуму)
+# IBAN України: фіксовані 29 символів (UA + 2 контрольні цифри + 25), без вкладених квантифікаторів
+IBAN_RE = re.compile(r"UA\d{2}[A-Z0-9]{25}")
+CARD_RE = re.compile(r"\d{13,19}")
+IPN_RE = re.compile(r"\d{10}")
+UNZR_RE = re.compile(r"\d{13}")
+DIGIT_RE = re.compile(r"\d")
+# Паспорт-книжечка: 2 символи + 6 цифр
+# Вимагаємо розділювачі, щоб не ловити шматки на кшталт "http://..."
+PASSPORT_BOOK_RE = re.compile(r"(?<![A-Z0-9])[A-Z]{2}\d{6}(?!\d)")
+
+# Шаблони для сирого тексту
+# ID-картка: 9 цифр поруч із ключовими словами
+PASSPORT_ID_RE = re.compile(
+    r"(?i)(документ\s*№|номер\s*паспорта|document\s*no)\s*[:#]?\s*([0-9\W]{9,14})"
+)
+UNZR_DASHED_RE = re.compile(r"(?<!\d)\d{8}-\d{5}(?!\d)")
+
+_NAME_UPPER = "А-ЯІЇЄҐ"
+_NAME_LOWER = "а-яіїєґ''`"
+# Heuristic: 3 capitalized words in Cyrillic (Surname Name Patronymic)
+NAME_RE = re.compile(
+    fr"(?<![{_NAME_LOWER}{_NAME_UPPER}])[{_NAME_UPPER}][{_NAME_LOWER}]+\s+"
+    fr"[{_NAME_UPPER}][{_NAME_LOWER}]+\s+[{_NAME_UPPER}][{_NAME_LOWER}]+"
+    fr"(?![{_NAME_LOWER}{_NAME_UPPER}])"
+)
+
+# Детектори сирого тексту: (тип, шаблон, обов'язковий підрядок або None).
+# Шаблон запускаємо лише якщо в тексті є підрядок, без якого збіг неможливий:
+# перевірка `in` значно дешевша за повний прохід regex по тексту.
+RAW_DETECTORS: Tuple[Tuple[str, "re.Pattern[str]", str | None], ...] = (
+    ("EMAIL", EMAIL_RE, "@"),
+    ("PHONE", PHONE_RE, None),
+    ("JWT", JWT_RE, "."),
+    ("PRIVATE_KEY", PKEY_RE, "PRIVATE KEY-----"),
+    # Поля-мітки (маскуємо весь рядок)
+    ("NAME", re.compile(r"(?i)ПІБ\s*:.*"), ":"),
+    ("ADDRESS", re.compile(r"(?i)Адреса\s*:.*"), ":"),
+    ("DOB", re.compile(r"(?i)Дата народження\s*:.*"), ":"),
+)
+
 # Пріоритети типів (більше число — важливіший при конфліктах)
 PRIORITY: Dict[str, int] = {
     "PRIVATE_KEY": 100,
@@ -155,7 +198,9 @@ def _rnokpp_ok(d10: str) -> bool:
 
 def _det_iban(canon: str, mapping: List[int], src: str) -> List[Span]:
     out: List[Span] = []
-    for m in re.finditer(r"UA[A-Z0-9]{27}", canon):
+    if "UA" not in canon:
+        return out
+    for m in IBAN_RE.finditer(canon):
         raw = canon[m.start() : m.end()]
         if _iban_ok(raw):
             i, j = _map_back(mapping, m.start(), m.end(), src)
@@ -165,7 +210,7 @@ def _det_iban(canon: str, mapping: List[int], src: str) -> List[Span]:
 
 def _det_card(canon: str, mapping: List[int], src: str) -> List[Span]:
     out: List[Span] = []
-    for m in re.finditer(r"\d{13,19}", canon):
+    for m in CARD_RE.finditer(canon):
         digits = canon[m.start() : m.end()]
         if _luhn_ok(digits):
             i, j = _map_back(mapping, m.start(), m.end(), src)
@@ -175,7 +220,7 @@ def _det_card(canon: str, mapping: List[int], src: str) -> List[Span]:
 
 def _det_ipn(canon: str, mapping: List[int], src: str) -> List[Span]:
     out: List[Span] = []
-    for m in re.finditer(r"\d{10}", canon):
+    for m in IPN_RE.finditer(canon):
         d = canon[m.start() : m.end()]
         i, j = _map_back(mapping, m.start(), m.end(), src)
         near = src[max(0, i - 30) : min(len(src), j + 30)].lower()
@@ -188,16 +233,10 @@ def _det_ipn(canon: str, mapping: List[int], src: str) -> List[Span]:
 
 def _det_passports(canon: str, mapping: List[int], src: str) -> List[Span]:
     out: List[Span] = []
-    # Паспорт-книжечка: 2 символи + 6 цифр
-    # Вимагаємо розділювачі, щоб не ловити шматки на кшталт "http://..."
-    for m in re.finditer(r"(?<![A-Z0-9])[A-Z]{2}\d{6}(?!\d)", canon):
+    for m in PASSPORT_BOOK_RE.finditer(canon):
         i, j = _map_back(mapping, m.start(), m.end(), src)
         out.append(Span(i, j, "PASSPORT_BOOK", PRIORITY["PASSPORT_BOOK"]))
-    # ID-картка: 9 цифр поруч із ключовими словами у сирому тексті
-    for m in re.finditer(
-        r"(?i)(документ\s*№|номер\s*паспорта|document\s*no)\s*[:#]?\s*([0-9\W]{9,14})",
-        src,
-    ):
+    for m in PASSPORT_ID_RE.finditer(src):
         out.append(Span(m.start(), m.end(), "PASSPORT_ID", PRIORITY["PASSPORT_ID"]))
     return out
 
@@ -205,11 +244,11 @@ def _det_passports(canon: str, mapping: List[int], src: str) -> List[Span]:
 def _det_unzr(canon: str, mapping: List[int], src: str) -> List[Span]:
     out: List[Span] = [
         Span(*_map_back(mapping, *m.span(), src), "UNZR", PRIORITY["UNZR"])
-        for m in re.finditer(r"\d{13}", canon)
+        for m in UNZR_RE.finditer(canon)
     ]
     out += [
         Span(m.start(), m.end(), "UNZR", PRIORITY["UNZR"])
-        for m in re.finditer(r"(?<!\d)\d{8}-\d{5}(?!\d)", src)
+        for m in UNZR_DASHED_RE.finditer(src)
     ]
     return out
 
@@ -217,21 +256,9 @@ def _det_unzr(canon: str, mapping: List[int], src: str) -> List[Span]:
 def _det_names(
     _canon: str, _mapping: List[int], src: str  # noqa: ARG001
 ) -> List[Span]:
-    out: List[Span] = []
-    # Heuristic: 3 capitalized words in Cyrillic (Surname Name Patronymic)
-    upper = "А-ЯІЇЄҐ"
-    lower = "а-яіїєґ''`"
-
-    # Pattern: Capitalized word, space, Capitalized word, space, Capitalized word
-    pattern = (
-        fr"(?<![{lower}{upper}])[{upper}][{lower}]+\s+"
-        fr"[{upper}][{lower}]+\s+[{upper}][{lower}]+(?![{lower}{upper}])"
-    )
-
-    for m in re.finditer(pattern, src):
-        out.append(Span(m.start(), m.end(), "NAME", PRIORITY["NAME"]))
-
-    return out
+    return [
+        Span(m.start(), m.end(), "NAME", PRIORITY["NAME"]) for m in NAME_RE.finditer(src)
+    ]
 
 
 def _det_raw(src: str) -> List[Span]:
@@ -247,23 +274,11 @@ def _det_raw(src: str) -> List[Span]:
         List[Span]: A list of detected raw PII spans.
     """
     out: List[Span] = []
-    for typ, rgx in (
-        ("EMAIL", EMAIL_RE),
-        ("PHONE", PHONE_RE),
-        ("JWT", JWT_RE),
-        ("PRIVATE_KEY", PKEY_RE),
-    ):
+    for typ, rgx, required in RAW_DETECTORS:
+        if required is not None and required not in src:
+            continue
         for m in rgx.finditer(src):
             out.append(Span(m.start(), m.end(), typ, PRIORITY[typ]))
-
-    # Поля-мітки (маскуємо весь рядок)
-    for typ, kw in (
-        ("NAME", "ПІБ"),
-        ("ADDRESS", "Адреса"),
-        ("DOB", "Дата народження"),
-    ):
-        for m in re.finditer(fr"(?i){kw}\s*:.*", src):
-            out.append(Span(m.start(), m.end(), typ, PRIORITY[typ]))
     return out
 
 
@@ -324,10 +339,14 @@ def sanitize_typed(text: str) -> Dict[str, object]:
     spans: List[Span] = []
     spans += _det_raw(text)
     spans += _det_iban(canon, mapping, text)
-    spans += _det_card(canon, mapping, text)
-    spans += _det_ipn(canon, mapping, text)
+    # Картки, ІПН та УНЗР складаються з цифр: без жодної цифри сканувати нема чого
+    has_digits = DIGIT_RE.search(canon) is not None
+    if has_digits:
+        spans += _det_card(canon, mapping, text)
+        spans += _det_ipn(canon, mapping, text)
     spans += _det_passports(canon, mapping, text)
-    spans += _det_unzr(canon, mapping, text)
+    if has_digits:
+        spans += _det_unzr(canon, mapping, text)
     spans += _det_names(canon, mapping, text)
 
     spans = _merge_typed(spans)
@@ -5,6 +5,8 @@ import re
 
 from backend.shared.errors import ValidationError
 
+NON_DIGITS_RE = re.compile(r"\D+")
+
 
 def _rnokpp_ok(code: str) -> bool:
     """
@@ -52,7 +54,7 @@ def _edrpou_ok(code: str) -> bool:
 
 def normalize_rnokpp(value: str) -> str:
     """Normalize and validate RNOKPP (Ukrainian tax ID, 10 digits)."""
-    cleaned = re.sub(r"\D+", "", value)
+    cleaned = NON_DIGITS_RE.sub("", value)
     if len(cleaned) != 10:
         raise ValidationError("РНОКПП має містити рівно 10 цифр")
     # Для сумісності з більш м’якою перевіркою допускаємо будь-які 10 цифр,
@@ -64,7 +66,7 @@ def normalize_edrpou(value: str) -> str:
     """
     Перевірка ЄДРПОУ з контрольної цифрою (8 або 10 цифр).
     """
-    cleaned = re.sub(r"\D+", "", value)
+    cleaned = NON_DIGITS_RE.sub("", value)
     if len(cleaned) not in (8, 10):
         raise ValidationError("ЄДРПОУ має містити 8 або 10 цифр")
     if not _edrpou_ok(cleaned):
@@ -59,6 +59,8 @@ class Settings:
         """Initialize session storage configuration."""
         self.redis_url: str | None = os.getenv("REDIS_URL")
         self.session_backend: str = (os.getenv("SESSION_BACKEND") or "redis").lower()
+        # Max pooled Redis connections shared by all requests of this process
+        self.redis_pool_size: int = self._get_int_env("REDIS_POOL_SIZE", 32)
         self.session_ttl_hours: int = self._get_int_env("SESSION_TTL_HOURS", 24)
         self.draft_ttl_hours: int = self._get_int_env("DRAFT_TTL_HOURS", 24)
         self.filled_ttl_hours: int = self._get_int_env("FILLED_TTL_HOURS", 24 * 7)
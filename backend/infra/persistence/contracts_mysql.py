@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import pymysql
@@ -14,11 +16,30 @@ from backend.shared.logging import get_logger
 logger = get_logger(__name__)
 
 
+_UPSERT_SQL = """
+    INSERT INTO contracts
+    (session_id, owner_user_id, category_id, template_id,
+     state, json_body, created_at, updated_at)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        owner_user_id=VALUES(owner_user_id),
+        category_id=VALUES(category_id),
+        template_id=VALUES(template_id),
+        state=VALUES(state),
+        json_body=VALUES(json_body),
+        updated_at=VALUES(updated_at)
+"""
+
+
 class MySQLContractsRepository:
     """MySQL-based contracts repository using PyMySQL."""
 
+    # Rows written per commit inside bulk_context()
+    BULK_COMMIT_EVERY = 1000
+
     def __init__(self, dsn: str) -> None:
         self.params = self._parse_dsn(dsn)
+        self._bulk = threading.local()
         self._ensure_table()
 
     def _parse_dsn(self, dsn: str) -> dict:
@@ -62,40 +83,73 @@ class MySQLContractsRepository:
             logger.error("Failed to ensure contracts table: %s", exc)
             raise
 
+    @contextmanager
+    def bulk_context(self) -> Iterator[None]:
+        """Write through one non-autocommit connection, committing every BULK_COMMIT_EVERY rows."""
+        if getattr(self._bulk, "conn", None) is not None:
+            # Nested call (e.g. bulk_create_or_update inside a migration): reuse the connection
+            yield
+            return
+        conn = pymysql.connect(**{**self.params, "autocommit": False})
+        self._bulk.conn = conn
+        self._bulk.pending = 0
+        try:
+            yield
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._bulk.conn = None
+            conn.close()
+
     def create_or_update(self, session: Session, payload: Dict[str, Any]) -> None:
         """Create or update a contract record in MySQL."""
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        conn = getattr(self._bulk, "conn", None)
+        if conn is not None:
+            self._upsert(conn, session, payload)
+            self._bulk.pending += 1
+            if self._bulk.pending >= self.BULK_COMMIT_EVERY:
+                conn.commit()
+                self._bulk.pending = 0
+            return
+
         conn = self._conn()
         try:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO contracts
-                    (session_id, owner_user_id, category_id, template_id,
-                     state, json_body, created_at, updated_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                        owner_user_id=VALUES(owner_user_id),
-                        category_id=VALUES(category_id),
-                        template_id=VALUES(template_id),
-                        state=VALUES(state),
-                        json_body=VALUES(json_body),
-                        updated_at=VALUES(updated_at)
-                    """,
-                    (
-                        session.session_id,
-                        session.creator_user_id,
-                        session.category_id,
-                        session.template_id,
-                        session.state.value,
-                        json.dumps(payload, ensure_ascii=False),
-                        now,
-                        now,
-                    ),
-                )
+            self._upsert(conn, session, payload)
         finally:
             conn.close()
 
+    def bulk_create_or_update(self, items: List[Tuple[Session, Dict[str, Any]]]) -> None:
+        """Upsert many records; PyMySQL turns executemany into multi-row VALUES."""
+        rows = [self._row(session, payload) for session, payload in items]
+        with self.bulk_context():
+            conn = self._bulk.conn
+            # ~1000-row statements stay well under max_allowed_packet
+            for start in range(0, len(rows), self.BULK_COMMIT_EVERY):
+                with conn.cursor() as cur:
+                    cur.executemany(_UPSERT_SQL, rows[start : start + self.BULK_COMMIT_EVERY])
+                conn.commit()
+
+    @staticmethod
+    def _row(session: Session, payload: Dict[str, Any]) -> tuple:
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        return (
+            session.session_id,
+            session.creator_user_id,
+            session.category_id,
+            session.template_id,
+            session.state.value,
+            json.dumps(payload, ensure_ascii=False),
+            now,
+            now,
+        )
+
+    @classmethod
+    def _upsert(cls, conn, session: Session, payload: Dict[str, Any]) -> None:
+        with conn.cursor() as cur:
+            cur.execute(_UPSERT_SQL, cls._row(session, payload))
+
     def get_by_session_id(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a contract by session ID from MySQL."""
         conn = self._conn()
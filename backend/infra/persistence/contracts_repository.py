@@ -1,10 +1,12 @@
 """Contracts repository abstraction with SQLite and MySQL backends."""
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import json
 import sqlite3
+import threading
 
 from backend.domain.sessions.models import Session
 from backend.infra.config.settings import settings
@@ -47,6 +49,21 @@ class ContractsRepository:
         """Create or update a contract record."""
         raise NotImplementedError
 
+    @contextmanager
+    def bulk_context(self) -> Iterator[None]:
+        """
+        Group many create_or_update calls (e.g. a migration) into few commits.
+
+        Backends without transactions need nothing special here.
+        """
+        yield
+
+    def bulk_create_or_update(self, items: List[Tuple[Session, Dict[str, Any]]]) -> None:
+        """Create or update many contract records at once."""
+        with self.bulk_context():
+            for session, payload in items:
+                self.create_or_update(session, payload)
+
     def get_by_session_id(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a contract by session ID."""
         raise NotImplementedError
@@ -56,12 +73,32 @@ class ContractsRepository:
         raise NotImplementedError
 
 
+_SQLITE_UPSERT_SQL = """
+    INSERT INTO contracts
+    (id, session_id, category_id, template_id, state,
+     owner_user_id, json_payload, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(session_id) DO UPDATE SET
+        category_id=excluded.category_id,
+        template_id=excluded.template_id,
+        state=excluded.state,
+        owner_user_id=excluded.owner_user_id,
+        json_payload=excluded.json_payload,
+        updated_at=excluded.updated_at
+"""
+
+
 class SQLiteContractsRepository(ContractsRepository):
     """SQLite-based contracts repository implementation."""
 
+    # Rows written per commit inside bulk_context()
+    BULK_COMMIT_EVERY = 1000
+
     def __init__(self, db_path: Path | None = None) -> None:
         self.db_path = db_path or (settings.meta_users_documents_root / "contracts.db")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-thread bulk connection: other threads keep their own short-lived ones
+        self._bulk = threading.local()
 
     def _conn(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path)
@@ -83,10 +120,56 @@ class SQLiteContractsRepository(ContractsRepository):
         conn.commit()
         return conn
 
+    @contextmanager
+    def bulk_context(self) -> Iterator[None]:
+        """Write through one connection, committing every BULK_COMMIT_EVERY rows."""
+        if getattr(self._bulk, "conn", None) is not None:
+            # Nested call (e.g. bulk_create_or_update inside a migration): reuse the connection
+            yield
+            return
+        conn = self._conn()
+        # synchronous=NORMAL lives only on this connection; journal_mode would persist in the file
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._bulk.conn = conn
+        self._bulk.pending = 0
+        try:
+            yield
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._bulk.conn = None
+            conn.close()
+
     def create_or_update(self, session: Session, payload: Dict[str, Any]) -> None:
+        conn = getattr(self._bulk, "conn", None)
+        if conn is not None:
+            self._upsert(conn, session, payload)
+            self._bulk.pending += 1
+            if self._bulk.pending >= self.BULK_COMMIT_EVERY:
+                conn.commit()
+                self._bulk.pending = 0
+            return
+
         conn = self._conn()
+        self._upsert(conn, session, payload)
+        conn.commit()
+        conn.close()
+
+    def bulk_create_or_update(self, items: List[Tuple[Session, Dict[str, Any]]]) -> None:
+        """Upsert many records with executemany, BULK_COMMIT_EVERY rows per statement batch."""
+        rows = [self._row(session, payload) for session, payload in items]
+        with self.bulk_context():
+            conn = self._bulk.conn
+            for start in range(0, len(rows), self.BULK_COMMIT_EVERY):
+                conn.executemany(_SQLITE_UPSERT_SQL, rows[start : start + self.BULK_COMMIT_EVERY])
+                conn.commit()
+
+    @staticmethod
+    def _row(session: Session, payload: Dict[str, Any]) -> tuple:
         now = session.updated_at.isoformat()
-        data = (
+        return (
             f"{session.session_id}",
             session.session_id,
             session.category_id,
@@ -97,24 +180,10 @@ class SQLiteContractsRepository(ContractsRepository):
             now,
             now,
         )
-        conn.execute(
-            """
-            INSERT INTO contracts
-            (id, session_id, category_id, template_id, state,
-             owner_user_id, json_payload, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(session_id) DO UPDATE SET
-                category_id=excluded.category_id,
-                template_id=excluded.template_id,
-                state=excluded.state,
-                owner_user_id=excluded.owner_user_id,
-                json_payload=excluded.json_payload,
-                updated_at=excluded.updated_at
-            """,
-            data,
-        )
-        conn.commit()
-        conn.close()
+
+    @classmethod
+    def _upsert(cls, conn: sqlite3.Connection, session: Session, payload: Dict[str, Any]) -> None:
+        conn.execute(_SQLITE_UPSERT_SQL, cls._row(session, payload))
 
     def get_by_session_id(self, session_id: str) -> Optional[Dict[str, Any]]:
         conn = self._conn()
@@ -159,6 +228,45 @@ class SQLiteContractsRepository(ContractsRepository):
         return result
 
 
+class InMemoryContractsRepository(ContractsRepository):
+    """Dict-backed contracts repository (tests and ephemeral runs, no disk I/O)."""
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, Dict[str, Any]] = {}
+
+    def create_or_update(self, session: Session, payload: Dict[str, Any]) -> None:
+        self._rows[session.session_id] = {
+            "session_id": session.session_id,
+            "category_id": session.category_id,
+            "template_id": session.template_id,
+            "state": session.state.value,
+            "owner_user_id": session.creator_user_id,
+            # Stored serialized so callers never share mutable payloads
+            "json_payload": json.dumps(payload, ensure_ascii=False),
+            "updated_at": session.updated_at.isoformat(),
+        }
+
+    def get_by_session_id(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self._rows.get(session_id)
+        if row is None:
+            return None
+        return json.loads(row["json_payload"])
+
+    def list_for_user(self, user_id: str) -> List[Dict[str, Any]]:
+        return [
+            {
+                "session_id": row["session_id"],
+                "category_id": row["category_id"],
+                "template_id": row["template_id"],
+                "state": row["state"],
+                "updated_at": row["updated_at"],
+                "document": json.loads(row["json_payload"]),
+            }
+            for row in self._rows.values()
+            if row["owner_user_id"] == user_id
+        ]
+
+
 def get_contracts_repo() -> ContractsRepository:
     """Get or create the singleton contracts repository instance."""
     if _repo_state.instance is None:
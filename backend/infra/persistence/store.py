@@ -8,7 +8,7 @@ from __future__ import annotations
 import asyncio
 import threading
 from contextlib import asynccontextmanager, contextmanager
-from typing import Generator, Optional
+from typing import Generator, Iterable, Optional
 
 from backend.infra.config.settings import settings
 from backend.shared.logging import get_logger
@@ -18,6 +18,7 @@ from backend.infra.persistence.store_memory import (
     list_user_sessions as memory_list_user_sessions,
     load_session as memory_load_session,
     save_session as memory_save_session,
+    save_sessions as memory_save_sessions,
     aget_or_create_session as memory_aget_or_create_session,
     alist_user_sessions as memory_alist_user_sessions,
     aload_session as memory_aload_session,
@@ -40,6 +41,7 @@ __all__ = [
     "get_or_create_session",
     "load_session",
     "save_session",
+    "save_sessions",
     "transactional_session",
     "list_user_sessions",
     "aget_or_create_session",
@@ -140,6 +142,22 @@ def save_session(session: Session, _locked_by_caller: bool = False) -> None:
     return memory_save_session(session)
 
 
+async def _redis_save_all(sessions: list[Session]) -> None:
+    for session in sessions:
+        await redis_asave_session(session)
+
+
+def save_sessions(sessions: Iterable[Session]) -> None:
+    """Save several sessions at once (sync)."""
+    sessions = list(sessions)
+    if _redis_allowed():
+        try:
+            return _run(_redis_save_all(sessions))
+        except (ConnectionError, TimeoutError, OSError, RuntimeError) as exc:
+            logger.error("Redis save_sessions failed, fallback to memory: %s", exc)
+    return memory_save_sessions(sessions)
+
+
 @contextmanager
 def transactional_session(session_id: str) -> Generator[Session, None, None]:
     """Context manager for transactional session access (sync).
@@ -1,18 +1,23 @@
 """In-memory session store implementation."""
 from __future__ import annotations
 
-import json
 import asyncio
 import threading
 from contextlib import contextmanager, asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Generator
+from typing import Generator, Iterable
 
 from backend.infra.config.settings import settings
 from backend.shared.errors import SessionNotFoundError
 from backend.domain.documents.user_document import save_user_document
 from backend.domain.sessions.models import Session
-from backend.infra.persistence.store_utils import _from_dict, session_to_dict
+from backend.infra.persistence.store_utils import (
+    _from_dict,
+    dumps_payload,
+    loads_payload,
+    next_updated_at,
+    session_to_dict,
+)
 from backend.shared.async_utils import run_sync
 
 # Lazy import to avoid circular dependency
@@ -22,7 +27,7 @@ except ImportError:
     _ttl_hours_for_session = None
 
 # In-memory storage structures
-_sessions: dict[str, str] = {}
+_sessions: dict[str, str | bytes] = {}
 _expires_at: dict[str, datetime] = {}
 _session_users: dict[str, set[str]] = {}
 _user_index: dict[str, dict[str, int]] = {}
@@ -119,23 +124,35 @@ def _update_indexes(session: Session) -> None:
     _session_users[session.session_id] = new_users
 
 
-def save_session(session: Session) -> None:
-    """Save session to in-memory store."""
-    session.updated_at = datetime.now(timezone.utc)
+def _prepare_save(session: Session) -> tuple[str | bytes, datetime]:
+    """Stamp updated_at and serialize; returns (payload, expire_at)."""
+    session.updated_at = next_updated_at()
     data = session_to_dict(session)
-    payload = json.dumps(data, ensure_ascii=False)
+    payload = dumps_payload(data)
     ttl_seconds = _session_ttl_seconds(session)
-    expire_at = session.updated_at + timedelta(seconds=ttl_seconds)
+    return payload, session.updated_at + timedelta(seconds=ttl_seconds)
+
+
+def save_session(session: Session) -> None:
+    """Save session to in-memory store."""
+    save_sessions([session])
+
+
+def save_sessions(sessions: Iterable[Session]) -> None:
+    """Save several sessions to in-memory store under one lock acquisition."""
+    prepared = [(session, *_prepare_save(session)) for session in sessions]
 
     with _global_lock:
-        _sessions[session.session_id] = payload
-        _expires_at[session.session_id] = expire_at
-        _update_indexes(session)
+        for session, payload, expire_at in prepared:
+            _sessions[session.session_id] = payload
+            _expires_at[session.session_id] = expire_at
+            _update_indexes(session)
 
-    try:
-        save_user_document(session)
-    except (OSError, ValueError):
-        pass
+    for session, _payload, _expire_at in prepared:
+        try:
+            save_user_document(session)
+        except (OSError, ValueError):
+            pass
 
 
 def load_session(session_id: str) -> Session:
@@ -146,7 +163,7 @@ def load_session(session_id: str) -> Session:
         payload = _sessions.get(session_id)
     if payload is None:
         raise SessionNotFoundError(f"Session '{session_id}' not found")
-    data = json.loads(payload)
+    data = loads_payload(payload)
     return _from_dict(data)
 
 
@@ -215,11 +232,7 @@ def _reset_for_tests() -> None:
 # Async variants (lightweight locking; reuses same in-memory structures)
 async def asave_session(session: Session) -> None:
     """Save session to in-memory store (async)."""
-    session.updated_at = datetime.now(timezone.utc)
-    data = session_to_dict(session)
-    payload = json.dumps(data, ensure_ascii=False)
-    ttl_seconds = _session_ttl_seconds(session)
-    expire_at = session.updated_at + timedelta(seconds=ttl_seconds)
+    payload, expire_at = _prepare_save(session)
 
     async with _get_async_global_lock():
         _sessions[session.session_id] = payload
@@ -240,7 +253,7 @@ async def aload_session(session_id: str) -> Session:
         payload = _sessions.get(session_id)
     if payload is None:
         raise SessionNotFoundError(f"Session '{session_id}' not found")
-    data = json.loads(payload)
+    data = loads_payload(payload)
     return _from_dict(data)
 
 
@@ -1,18 +1,23 @@
 """Redis-based session persistence with distributed locking."""
 from __future__ import annotations
 
-import json
 import asyncio
 import uuid
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 from backend.domain.sessions.ttl import ttl_hours_for_session
 from backend.shared.errors import SessionNotFoundError
 from backend.domain.documents.user_document import save_user_document_async
 from backend.domain.sessions.models import Session
-from backend.infra.persistence.store_utils import _from_dict, session_to_dict
+from backend.infra.persistence.store_utils import (
+    _from_dict,
+    dumps_payload,
+    loads_payload,
+    next_updated_at,
+    session_to_dict,
+)
 from backend.infra.storage.redis_client import get_redis
+from backend.shared.async_utils import run_sync
 from backend.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -22,6 +27,9 @@ USER_INDEX_PREFIX = "user_sessions:"
 LOCK_PREFIX = "session_lock:"
 DEFAULT_LOCK_TTL = 10
 DEFAULT_LOCK_WAIT_TIMEOUT = 5
+# From this many sessions on, list decoding runs in the threadpool so a
+# large listing does not stall the event loop (one hop for the whole batch)
+THREADED_DECODE_MIN_SESSIONS = 64
 
 
 def _session_key(session_id: str) -> str:
@@ -36,26 +44,92 @@ def _lock_key(session_id: str) -> str:
     return f"{LOCK_PREFIX}{session_id}"
 
 
-async def save_session(session: Session) -> None:
-    """Save session to Redis with TTL and update user indexes."""
-    redis = await get_redis()
-    session.updated_at = datetime.now(timezone.utc)
+# Lock release only deletes the key while it still holds our token.
+# KEYS: lock; ARGV: token
+_RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Transactional save: payload, user-index entries and lock release in one
+# atomic call. KEYS: lock, session, user indexes...;
+# ARGV: token, payload, ttl seconds, session id, index score
+_SAVE_AND_RELEASE_LUA = """
+redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+for i = 3, #KEYS do
+    redis.call('ZADD', KEYS[i], ARGV[5], ARGV[4])
+end
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Create-if-absent: the user-index entry is added only when SET NX wins.
+# KEYS: session, user indexes...; ARGV: payload, ttl seconds, index score, session id
+_CREATE_LUA = """
+if not redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    return 0
+end
+for i = 2, #KEYS do
+    redis.call('ZADD', KEYS[i], ARGV[3], ARGV[4])
+end
+return 1
+"""
+
+
+class _ScriptHolder:
+    """Lua script objects registered on the current Redis client."""
+
+    def __init__(self) -> None:
+        self.client: Any = None
+        self.scripts: dict[str, Any] = {}
 
-    data = session_to_dict(session)
-    payload = json.dumps(data, ensure_ascii=False)
+    def get(self, redis: Any, source: str) -> Any:
+        """Return the script for source, registering it once per client."""
+        if redis is not self.client:
+            self.client = redis
+            self.scripts = {}
+        script = self.scripts.get(source)
+        if script is None:
+            script = self.scripts[source] = redis.register_script(source)
+        return script
+
+
+_scripts = _ScriptHolder()
+
+
+def _prepare_save(session: Session) -> tuple[str | bytes, int, list[str]]:
+    """Stamp updated_at and serialize; returns (payload, ttl_seconds, index_keys)."""
+    session.updated_at = next_updated_at()
+    payload = dumps_payload(session_to_dict(session))
     ttl_seconds = max(ttl_hours_for_session(session) * 3600, 1)
-    await redis.set(_session_key(session.session_id), payload, ex=ttl_seconds)
 
     participants = set((session.role_owners or {}).values())
     if session.creator_user_id:
         participants.add(session.creator_user_id)
-    if participants:
-        ts = session.updated_at.timestamp()
-        mapping = {session.session_id: ts}
-        for uid in participants:
-            if uid:
-                await redis.zadd(_user_index_key(uid), mapping)
+    return payload, ttl_seconds, [_user_index_key(uid) for uid in participants if uid]
 
+
+async def save_session(session: Session) -> None:
+    """Save session to Redis with TTL and update user indexes."""
+    redis = await get_redis()
+    payload, ttl_seconds, index_keys = _prepare_save(session)
+
+    # Payload and index entries go out in one MULTI/EXEC round trip
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.set(_session_key(session.session_id), payload, ex=ttl_seconds)
+        mapping = {session.session_id: session.updated_at.timestamp()}
+        for key in index_keys:
+            pipe.zadd(key, mapping)
+        await pipe.execute()
+
+    await _save_user_document(session)
+
+
+async def _save_user_document(session: Session) -> None:
     try:
         await save_user_document_async(session)
     except (OSError, ValueError, RuntimeError) as exc:
@@ -66,10 +140,13 @@ async def load_session(session_id: str) -> Session:
     """Load session from Redis by ID."""
     redis = await get_redis()
     raw = await redis.get(_session_key(session_id))
+    return _session_from_payload(session_id, raw)
+
+
+def _session_from_payload(session_id: str, raw: str | bytes | None) -> Session:
     if raw is None:
         raise SessionNotFoundError(f"Session '{session_id}' not found")
-    data = json.loads(raw)
-    return _from_dict(data)
+    return _from_dict(loads_payload(raw))
 
 
 async def get_or_create_session(session_id: str, user_id: str | None = None) -> Session:
@@ -77,9 +154,22 @@ async def get_or_create_session(session_id: str, user_id: str | None = None) ->
     try:
         return await load_session(session_id)
     except SessionNotFoundError:
-        session = Session(session_id=session_id, creator_user_id=user_id)
-        await save_session(session)
-        return session
+        pass
+
+    redis = await get_redis()
+    session = Session(session_id=session_id, creator_user_id=user_id)
+    payload, ttl_seconds, index_keys = _prepare_save(session)
+    # SET NX: a concurrent creator between our GET and SET must not be overwritten
+    create = _scripts.get(redis, _CREATE_LUA)
+    created = await create(
+        keys=[_session_key(session_id), *index_keys],
+        args=[payload, ttl_seconds, session.updated_at.timestamp(), session_id],
+    )
+    if not created:
+        return await load_session(session_id)
+
+    await _save_user_document(session)
+    return session
 
 
 @asynccontextmanager
@@ -96,27 +186,44 @@ async def transactional_session(
     lock_key = _lock_key(session_id)
 
     while loop.time() < deadline:
-        acquired = await redis.set(lock_key, token, nx=True, ex=lock_ttl)
+        # Lock attempt and session read share one round trip; the GET runs
+        # after the SET NX on the server, so a won lock comes with fresh data
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(lock_key, token, nx=True, ex=lock_ttl)
+            pipe.get(_session_key(session_id))
+            acquired, raw = await pipe.execute()
         if acquired:
             break
         await asyncio.sleep(0.05)
     else:
         raise TimeoutError(f"Could not acquire lock for session {session_id}")
 
+    released = False
     try:
-        session = await load_session(session_id)
+        session = _session_from_payload(session_id, raw)
         yield session
-        await save_session(session)
+        payload, ttl_seconds, index_keys = _prepare_save(session)
+        # The save still lands if the lock expired meanwhile (as before); only
+        # the release is conditional on the token
+        save_and_release = _scripts.get(redis, _SAVE_AND_RELEASE_LUA)
+        await save_and_release(
+            keys=[lock_key, _session_key(session_id), *index_keys],
+            args=[token, payload, ttl_seconds, session_id, session.updated_at.timestamp()],
+        )
+        released = True
     finally:
-        try:
-            val = await redis.get(lock_key)
-            # Redis returns bytes, token is str - decode for comparison
-            if val is not None:
-                val_str = val.decode("utf-8") if isinstance(val, bytes) else val
-                if val_str == token:
-                    await redis.delete(lock_key)
-        except (ConnectionError, TimeoutError, OSError):
-            pass  # Lock cleanup is best-effort
+        if not released:
+            try:
+                release = _scripts.get(redis, _RELEASE_LOCK_LUA)
+                await release(keys=[lock_key], args=[token])
+            except (ConnectionError, TimeoutError, OSError):
+                pass  # Lock cleanup is best-effort
+
+    await _save_user_document(session)
+
+
+def _decode_payloads(payloads: list[str | bytes | None]) -> list[Session | None]:
+    return [None if raw is None else _from_dict(loads_payload(raw)) for raw in payloads]
 
 
 async def list_user_sessions(user_id: str) -> list[Session]:
@@ -126,16 +233,24 @@ async def list_user_sessions(user_id: str) -> list[Session]:
 
     redis = await get_redis()
     key = _user_index_key(user_id)
-    session_ids = await redis.zrevrange(key, 0, -1)
+    # Redis may return bytes, decode if needed
+    session_ids = [
+        sid.decode("utf-8") if isinstance(sid, bytes) else sid
+        for sid in await redis.zrevrange(key, 0, -1)
+    ]
+    if not session_ids:
+        return []
+    # One MGET for all payloads instead of a GET round trip per session
+    payloads = await redis.mget([_session_key(sid) for sid in session_ids])
+    if len(payloads) >= THREADED_DECODE_MIN_SESSIONS:
+        decoded = await run_sync(_decode_payloads, payloads)
+    else:
+        decoded = _decode_payloads(payloads)
     sessions: list[Session] = []
     stale_ids: list[str] = []
 
-    for raw_session_id in session_ids:
-        # Redis may return bytes, decode if needed
-        session_id = raw_session_id.decode("utf-8") if isinstance(raw_session_id, bytes) else raw_session_id
-        try:
-            session = await load_session(session_id)
-        except SessionNotFoundError:
+    for session_id, session in zip(session_ids, decoded):
+        if session is None:
             stale_ids.append(session_id)
             continue
 
@@ -1,12 +1,36 @@
 """Utility functions for session serialization and deserialization."""
 from __future__ import annotations
 
-from dataclasses import asdict
-from datetime import datetime, timezone
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+import json
+import threading
+import time
 import uuid
 
 from backend.domain.sessions.models import FieldState, Session, SessionState
 
+# orjson (in requirements.txt) is C-implemented and emits UTF-8 bytes directly;
+# the stdlib fallback keeps bare environments working
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_payload(data: dict) -> str | bytes:
+    """Serialize a session dict to JSON (bytes with orjson, str otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(data)  # pylint: disable=no-member
+    return json.dumps(data, ensure_ascii=False)
+
+
+def loads_payload(raw: str | bytes) -> dict:
+    """Parse a JSON session payload produced by dumps_payload."""
+    if orjson is not None:
+        return orjson.loads(raw)  # pylint: disable=no-member
+    return json.loads(raw)
+
 
 def _parse_field_status(raw_status, error: str | None) -> str:
     """
@@ -29,6 +53,39 @@ def _parse_field_status(raw_status, error: str | None) -> str:
     return "empty"
 
 
+_CANONICAL_STATUSES = frozenset(("ok", "error", "empty"))
+
+
+def _field_state_from_dict(value: dict) -> FieldState:
+    """Build a FieldState, normalizing the status only for legacy payloads."""
+    status = value.get("status")
+    error = value.get("error")
+    # Payloads written by session_to_dict already carry a canonical string
+    if not (isinstance(status, str) and status in _CANONICAL_STATUSES):
+        status = _parse_field_status(status, error)
+    return FieldState(status, error)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_stamp_lock = threading.Lock()
+_last_stamp_us = 0  # pylint: disable=invalid-name
+
+
+def next_updated_at() -> datetime:
+    """
+    Return the current UTC time for a session's updated_at.
+
+    Stamps are strictly increasing within the process (at the microsecond
+    resolution datetime keeps), so back-to-back saves order correctly even
+    when the wall clock has not advanced between them.
+    """
+    global _last_stamp_us  # pylint: disable=global-statement
+    with _stamp_lock:
+        _last_stamp_us = max(time.time_ns() // 1000, _last_stamp_us + 1)
+        stamp_us = _last_stamp_us
+    return _EPOCH + timedelta(microseconds=stamp_us)
+
+
 def generate_readable_id(_prefix: str = "session") -> str:
     """
     Generate a unique session ID (UUID).
@@ -50,22 +107,17 @@ def _from_dict(data: dict) -> Session:
     for role, fields_dict in raw_party_fields.items():
         if not isinstance(fields_dict, dict):
             continue
-        role_fields = {}
-        for key, value in fields_dict.items():
-            error = value.get("error")
-            status = _parse_field_status(value.get("status"), error)
-            role_fields[key] = FieldState(status=status, error=error)
-        party_fields[role] = role_fields
+        party_fields[role] = {
+            key: _field_state_from_dict(value) for key, value in fields_dict.items()
+        }
 
     # Підтримка попереднього формату: якщо немає contract_fields, читаємо legacy "fields"
     raw_contract_fields = data.get("contract_fields")
     if raw_contract_fields is None:
         raw_contract_fields = data.get("fields") or {}
-    contract_fields: dict[str, FieldState] = {}
-    for key, value in raw_contract_fields.items():
-        error = value.get("error")
-        status = _parse_field_status(value.get("status"), error)
-        contract_fields[key] = FieldState(status=status, error=error)
+    contract_fields: dict[str, FieldState] = {
+        key: _field_state_from_dict(value) for key, value in raw_contract_fields.items()
+    }
 
     # Deserialize updated_at
     updated_at_str = data.get("updated_at")
@@ -138,18 +190,27 @@ def _from_dict(data: dict) -> Session:
 # for consistency. Legacy boolean format is still read via _parse_field_status.
 
 
+_SESSION_FIELDS = tuple(f.name for f in fields(Session))
+
+
+def _field_state_dict(fs: FieldState) -> dict:
+    return {"status": fs.status, "error": fs.error}
+
+
 def session_to_dict(session: Session) -> dict:
     """Convert a Session object to a dictionary for serialization."""
-    data = asdict(session)
-    data["creator_user_id"] = session.creator_user_id
-    data["role_owners"] = session.role_owners
+    # Shallow field copy: the dict is serialized right away, so the deep copy
+    # dataclasses.asdict() makes of every nested dict/FieldState is wasted work
+    data = {name: getattr(session, name) for name in _SESSION_FIELDS}
+    data["party_fields"] = {
+        role: {key: _field_state_dict(fs) for key, fs in role_fields.items()}
+        for role, role_fields in session.party_fields.items()
+    }
+    data["contract_fields"] = {
+        key: _field_state_dict(fs) for key, fs in session.contract_fields.items()
+    }
     # party_users kept for backward compatibility in persisted payloads
     data["party_users"] = session.role_owners
-    data["party_types"] = session.party_types
-    data["filling_mode"] = session.filling_mode
-    data["signatures"] = session.signatures
-    data["required_roles"] = session.required_roles
-    data["history"] = session.history
     data["updated_at"] = session.updated_at.isoformat()
     data["state"] = session.state.value
     # Field statuses are stored as strings ("ok", "error", "empty")
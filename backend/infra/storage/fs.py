@@ -14,25 +14,48 @@ import aiofiles
 from backend.infra.config.settings import settings
 from backend.shared.async_utils import run_sync
 
+# orjson is in requirements.txt; the stdlib fallback keeps bare environments working
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# Directories this process has already created; write_json skips the
+# mkdir (and its stat of every parent) for them
+_known_dirs: set[Path] = set()
+
+
+def _make_dir(path: Path) -> None:
+    """Create a directory (with parents) and remember that it exists."""
+    path.mkdir(parents=True, exist_ok=True)
+    _known_dirs.add(path)
+
+
+def _ensure_dir(path: Path) -> None:
+    """Like _make_dir, but skipped for directories already created here."""
+    if path not in _known_dirs:
+        _make_dir(path)
+
 
 def ensure_directories() -> None:
     """Create all required directories for the application."""
     # Корінь
-    settings.documents_root.mkdir(parents=True, exist_ok=True)
+    _make_dir(settings.documents_root)
 
     # Meta-data
-    settings.meta_root.mkdir(parents=True, exist_ok=True)
-    settings.meta_categories_root.mkdir(parents=True, exist_ok=True)
-    settings.meta_users_root.mkdir(parents=True, exist_ok=True)
+    _make_dir(settings.meta_root)
+    _make_dir(settings.meta_categories_root)
+    _make_dir(settings.meta_users_root)
     # user meta subdirs: documents + sessions
-    settings.meta_users_documents_root.mkdir(parents=True, exist_ok=True)
-    settings.sessions_root.mkdir(parents=True, exist_ok=True)
+    _make_dir(settings.meta_users_documents_root)
+    _make_dir(settings.sessions_root)
 
     # Документи
-    settings.documents_files_root.mkdir(parents=True, exist_ok=True)
-    settings.default_documents_root.mkdir(parents=True, exist_ok=True)
+    _make_dir(settings.documents_files_root)
+    _make_dir(settings.default_documents_root)
 
-    settings.filled_documents_root.mkdir(parents=True, exist_ok=True)
+    _make_dir(settings.filled_documents_root)
 
 
 def session_answers_path(session_id: str) -> Path:
@@ -56,12 +79,20 @@ class FileLock:
     # Key: lock_path, Value: (owner_thread_ident, recursion_count)
     _memory_locks = {}
     _memory_lock_mutex = threading.RLock()
+    # Signalled on release so sibling threads wake up instead of polling
+    _memory_lock_released = threading.Condition(_memory_lock_mutex)
+
+    # Backoff bounds (seconds) while another process holds the lock file
+    _MIN_BACKOFF = 0.001
+    _MAX_BACKOFF = 0.1
 
     def __init__(self, path: Path, timeout: float = 10.0):
         self.path = path
         self.lock_path = path.with_suffix(path.suffix + ".lock")
         self.timeout = timeout
-        self._acquired = False
+        # Acquisitions held through this instance; nested `with lock:` blocks
+        # on one object each need their own release
+        self._depth = 0
 
     def _try_reentrant_acquire(self, thread_id: int) -> bool:
         """Try to acquire lock if already held by this thread."""
@@ -70,25 +101,39 @@ class FileLock:
                 owner, count = self._memory_locks[self.lock_path]
                 if owner == thread_id:
                     self._memory_locks[self.lock_path] = (owner, count + 1)
-                    self._acquired = True
+                    self._depth += 1
                     return True
         return False
 
-    def _is_held_by_sibling(self) -> bool:
-        """Check if lock is held by another thread in this process."""
-        with self._memory_lock_mutex:
-            return self.lock_path in self._memory_locks
-
-    def _create_lock_file(self, thread_id: int) -> bool:
+    def _claim_memory_slot(self, thread_id: int, deadline: float) -> None:
+        """Wait until no sibling thread holds the lock, then register this thread."""
+        with self._memory_lock_released:
+            while self.lock_path in self._memory_locks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._raise_timeout()
+                self._memory_lock_released.wait(remaining)
+            self._memory_locks[self.lock_path] = (thread_id, 1)
+
+    def _free_memory_slot(self, thread_id: int) -> None:
+        with self._memory_lock_released:
+            entry = self._memory_locks.get(self.lock_path)
+            if entry and entry[0] == thread_id:
+                del self._memory_locks[self.lock_path]
+            self._memory_lock_released.notify_all()
+
+    def _raise_timeout(self) -> None:
+        raise TimeoutError(
+            f"Could not acquire lock for {self.path} after {self.timeout}s"
+        )
+
+    def _create_lock_file(self) -> bool:
         """Try to create the lock file atomically."""
         try:
             with open(self.lock_path, "x", encoding="utf-8") as f:
                 f.write(str(os.getpid()))
                 f.flush()
                 os.fsync(f.fileno())
-            self._acquired = True
-            with self._memory_lock_mutex:
-                self._memory_locks[self.lock_path] = (thread_id, 1)
             return True
         except FileExistsError:
             return False
@@ -134,44 +179,41 @@ class FileLock:
         if self._try_reentrant_acquire(thread_id):
             return
 
-        start_time = time.time()
-        while True:
-            if self._is_held_by_sibling():
-                if time.time() - start_time > self.timeout:
-                    raise TimeoutError(
-                        f"Could not acquire lock for {self.path} after {self.timeout}s"
-                    )
-                time.sleep(0.05)
-                continue
-
-            if self._create_lock_file(thread_id):
-                return
-
-            if time.time() - start_time > self.timeout:
-                raise TimeoutError(
-                    f"Could not acquire lock for {self.path} after {self.timeout}s"
-                )
-
-            self._check_and_remove_stale_lock()
-            time.sleep(random.uniform(0.05, 0.1))
+        deadline = time.monotonic() + self.timeout
+        # Sibling threads queue on the in-memory slot; the lock file only
+        # arbitrates between processes
+        self._claim_memory_slot(thread_id, deadline)
+        try:
+            backoff = self._MIN_BACKOFF
+            while not self._create_lock_file():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._raise_timeout()
+
+                # Held by another process: retry with exponential backoff
+                self._check_and_remove_stale_lock()
+                time.sleep(min(backoff * random.uniform(1.0, 1.5), remaining))
+                backoff = min(backoff * 2, self._MAX_BACKOFF)
+        except BaseException:
+            self._free_memory_slot(thread_id)
+            raise
+        self._depth += 1
 
     def release(self) -> None:
         """Release the file lock."""
-        if not self._acquired:
+        if not self._depth:
             return
 
         thread_id = threading.get_ident()
         with self._memory_lock_mutex:
             if self.lock_path in self._memory_locks:
                 owner, count = self._memory_locks[self.lock_path]
-                if owner == thread_id:
-                    if count > 1:
-                        self._memory_locks[self.lock_path] = (owner, count - 1)
-                        self._acquired = False
-                        return
-                    # Last release, remove physical lock
-                    del self._memory_locks[self.lock_path]
+                if owner == thread_id and count > 1:
+                    self._memory_locks[self.lock_path] = (owner, count - 1)
+                    self._depth -= 1
+                    return
 
+        # Last release: remove the physical lock before waking sibling threads.
         # Retry deletion a few times to handle Windows transient file locking (e.g. antivirus)
         for _ in range(3):
             try:
@@ -180,7 +222,8 @@ class FileLock:
             except OSError:
                 time.sleep(0.01)
 
-        self._acquired = False
+        self._depth -= 1
+        self._free_memory_slot(thread_id)
 
     def __enter__(self):
         self.acquire()
@@ -190,10 +233,16 @@ class FileLock:
         self.release()
 
 
+def _decode_json(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson when installed, json otherwise)."""
+    if orjson is not None:
+        return orjson.loads(raw)  # pylint: disable=no-member
+    return json.loads(raw)
+
+
 def read_json(path: Path) -> Any:
     """Read and parse JSON file."""
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _decode_json(path.read_bytes())
 
 
 def write_json(path: Path, data: Any, locked_by_caller: bool = False) -> None:
@@ -201,19 +250,38 @@ def write_json(path: Path, data: Any, locked_by_caller: bool = False) -> None:
     Writes JSON to file.
     If locked_by_caller is True, skips acquiring lock (assumes caller holds it).
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(path.parent)
+    try:
+        _write_json_locked(path, data, locked_by_caller)
+    except FileNotFoundError:
+        # Cached directory was removed since (e.g. by cleanup): retry once
+        _make_dir(path.parent)
+        _write_json_locked(path, data, locked_by_caller)
 
+
+def _write_json_locked(path: Path, data: Any, locked_by_caller: bool) -> None:
     if locked_by_caller:
         _write_atomic(path, data)
     else:
         with FileLock(path):
             _write_atomic(path, data)
 
+
+def _encode_json(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON (same layout with or without orjson)."""
+    if orjson is not None:
+        # pylint: disable-next=no-member
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def _write_atomic(path: Path, data: Any) -> None:
     tmp_path = path.with_suffix(".tmp")
+    payload = _encode_json(data)
     try:
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Encoded up front so the file gets a single write before fsync
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, path)
@@ -228,16 +296,20 @@ def _write_atomic(path: Path, data: Any) -> None:
 # Async wrappers to avoid blocking event loop
 async def read_json_async(path: Path) -> Any:
     """Read and parse JSON file asynchronously."""
-    async with aiofiles.open(path, "r", encoding="utf-8") as f:
+    async with aiofiles.open(path, "rb") as f:
         content = await f.read()
-    return json.loads(content)
+    return _decode_json(content)
 
 
 async def write_json_async(path: Path, data: Any, locked_by_caller: bool = False) -> None:
     """Write JSON to file asynchronously."""
-    path.parent.mkdir(parents=True, exist_ok=True)
     if locked_by_caller:
-        await _write_atomic_async(path, data)
+        _ensure_dir(path.parent)
+        try:
+            await _write_atomic_async(path, data)
+        except FileNotFoundError:
+            _make_dir(path.parent)
+            await _write_atomic_async(path, data)
     else:
         # FileLock is sync; use threadpool to avoid blocking loop
         await run_sync(write_json, path, data, locked_by_caller=locked_by_caller)
@@ -246,8 +318,8 @@ async def write_json_async(path: Path, data: Any, locked_by_caller: bool = False
 async def _write_atomic_async(path: Path, data: Any) -> None:
     tmp_path = path.with_suffix(".tmp")
     try:
-        async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(data, ensure_ascii=False, indent=2))
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(_encode_json(data))
             await f.flush()
         await run_sync(os.replace, tmp_path, path)
     finally:
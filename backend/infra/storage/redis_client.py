@@ -34,6 +34,15 @@ async def get_redis() -> aioredis.Redis:
         return _holder.client
     if not settings.redis_url:
         raise RuntimeError("REDIS_URL is not set")
-    _holder.client = aioredis.Redis.from_url(settings.redis_url, decode_responses=True)
-    logger.info("Using Redis client (redis.asyncio)")
+    # Blocking pool: under a burst callers wait for a free connection instead of failing
+    pool = aioredis.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_pool_size,
+        timeout=5,
+        socket_keepalive=True,
+        health_check_interval=30,
+        decode_responses=True,
+    )
+    _holder.client = aioredis.Redis(connection_pool=pool)
+    logger.info("Using Redis client (redis.asyncio, pool size %s)", settings.redis_pool_size)
     return _holder.client
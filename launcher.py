@@ -131,6 +131,8 @@ def run_app(
         "log_config": None,
         "timeout_keep_alive": 5,
         "timeout_graceful_shutdown": 3,
+        # uvloop (з uvicorn[standard]), якщо встановлений; інакше asyncio
+        "loop": "auto",
     }
 
     if reload:
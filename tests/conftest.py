@@ -4,6 +4,7 @@ import asyncio
 import inspect
 import json
 import sys
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -25,141 +26,262 @@ except ModuleNotFoundError:
     sys.path.insert(0, ROOT_STR)
     from backend.infra.config.settings import Settings  # pylint: disable=unused-import
 
-@pytest.fixture
-def temp_workspace(tmp_path):
-    """Creates a temporary workspace with necessary subdirectories."""
+try:
+    from orjson import dumps as _json_bytes  # pylint: disable=no-name-in-module
+except ImportError:  # orjson is optional for the test suite
+    def _json_bytes(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+try:
+    import uvloop
+except ImportError:  # uvloop ships with uvicorn[standard], but not on Windows
+    uvloop = None
+
+# Категорія, яку повертає mock_categories_data; payload серіалізуємо один раз
+MOCK_CATEGORY_ID = "test_cat"
+_MOCK_CATEGORY_META = json.dumps({
+    "category_id": MOCK_CATEGORY_ID,
+    "templates": [{"id": "t1", "name": "T1", "file": "f1.docx"}],
+    "roles": {
+        "lessor": {"label": "Lessor", "allowed_person_types": ["individual", "company"]},
+        "lessee": {"label": "Lessee", "allowed_person_types": ["individual", "company"]}
+    },
+    "party_modules": {
+        "individual": {
+            "label": "Indiv",
+            "fields": [{"field": "name", "label": "Name", "required": True}]
+        },
+        "company": {
+            "label": "Comp",
+            "fields": [{"field": "name", "label": "Name", "required": True}]
+        }
+    },
+    "contract_fields": [
+        {"field": "cf1", "label": "CF1", "required": True}
+    ]
+})
+_MOCK_CATEGORY_INDEX = json.dumps(
+    {"categories": [{"id": MOCK_CATEGORY_ID, "label": "Test Cat", "keywords": ["test"]}]}
+)
+
+_SETTINGS_KEYS = [
+    "project_root", "assets_root", "documents_root", "meta_root",
+    "meta_categories_root", "meta_users_root", "meta_users_documents_root",
+    "sessions_root", "documents_files_root", "filled_documents_root",
+    "default_documents_root", "users_documents_root",
+    "session_backend", "session_ttl_hours", "redis_url",
+    "draft_ttl_hours", "filled_ttl_hours", "signed_ttl_days",
+    "contracts_db_url",
+    "auth_mode", "auth_jwt_secret", "auth_jwt_audience", "auth_jwt_algorithm",
+    "env", "is_dev", "is_prod",
+]
+
+
+def _workspace_overrides(workspace: Path) -> dict:
+    """Build settings overrides that point all paths into the workspace."""
+    assets_root = workspace / "assets"
+    # Re-construct derived paths based on the new assets_root
+    documents_root = assets_root
+    meta_root = documents_root / "meta_data"
+    meta_users_root = meta_root / "meta_data_users"
+    documents_files_root = documents_root / "documents_files"
+    return {
+        "project_root": workspace,
+        "assets_root": assets_root,
+        "documents_root": documents_root,
+        "meta_root": meta_root,
+        "meta_categories_root": meta_root / "meta_data_categories_documents",
+        "meta_users_root": meta_users_root,
+        "meta_users_documents_root": meta_users_root / "documents",
+        "sessions_root": meta_users_root / "sessions",
+        "documents_files_root": documents_files_root,
+        "filled_documents_root": documents_files_root / "filled_documents",
+        "default_documents_root": documents_files_root / "default_documents_files",
+        "users_documents_root": documents_files_root / "users_documents_files",
+        "session_backend": "memory",
+        "session_ttl_hours": 24,
+        "draft_ttl_hours": 24,
+        "filled_ttl_hours": 24 * 7,
+        "signed_ttl_days": 365,
+        "redis_url": None,
+        "auth_mode": "auto",
+        "auth_jwt_secret": None,
+        "auth_jwt_audience": None,
+        "auth_jwt_algorithm": "HS256",
+        "env": "test",
+        "is_dev": True,
+        "is_prod": False,
+    }
+
+
+@pytest.fixture(scope="module")
+def temp_workspace(tmp_path_factory):
+    """Creates a temporary workspace with necessary subdirectories (once per module)."""
+    root = tmp_path_factory.mktemp("workspace")
     # Create structure
-    (tmp_path / "assets" / "meta_data" / "meta_data_categories_documents").mkdir(parents=True)
-    (tmp_path / "assets" / "documents_files" / "default_documents_files").mkdir(parents=True)
-    (tmp_path / "assets" / "user_documents").mkdir(parents=True)
-    (tmp_path / "assets" / "session_answers").mkdir(parents=True)
-    return tmp_path
+    (root / "assets" / "meta_data" / "meta_data_categories_documents").mkdir(parents=True)
+    (root / "assets" / "documents_files" / "default_documents_files").mkdir(parents=True)
+    (root / "assets" / "user_documents").mkdir(parents=True)
+    (root / "assets" / "session_answers").mkdir(parents=True)
+    return root
+
+
+@pytest.fixture(scope="module")
+def module_settings_overrides(temp_workspace):
+    """Point settings at the module workspace once and restore them afterwards."""
+    # pylint: disable=import-outside-toplevel
+    from backend.infra.config.settings import settings
+
+    # Store original values to restore after the module
+    original_values = {
+        key: getattr(settings, key) for key in _SETTINGS_KEYS if hasattr(settings, key)
+    }
+    overrides = _workspace_overrides(temp_workspace)
+    for key, value in overrides.items():
+        setattr(settings, key, value)
+
+    # Ensure directories exist
+    for key in (
+        "meta_categories_root", "meta_users_documents_root", "sessions_root",
+        "default_documents_root", "users_documents_root", "filled_documents_root",
+    ):
+        overrides[key].mkdir(parents=True, exist_ok=True)
+
+    yield overrides
+
+    # Restore original values
+    for key, value in original_values.items():
+        setattr(settings, key, value)
+
 
 @pytest.fixture
-def mock_settings(temp_workspace):
-    """Overrides settings to use the temporary workspace."""
+def mock_settings(module_settings_overrides):
+    """Overrides settings to use the temporary workspace.
+
+    Paths and directories are prepared once per module; here we only re-apply
+    the overrides (tests may tweak them) and reset per-test in-memory state.
+    """
     # pylint: disable=import-outside-toplevel
     from backend.infra.config.settings import settings
     from backend.infra.persistence import store_memory, store
     from backend.infra.persistence import contracts_repository
     from backend.domain.categories import index as category_index
 
-    # Store original values to restore after test
-    original_values = {}
-    keys_to_update = [
-        "project_root", "assets_root", "documents_root", "meta_root",
-        "meta_categories_root", "meta_users_root", "meta_users_documents_root",
-        "sessions_root", "documents_files_root", "filled_documents_root",
-        "default_documents_root", "users_documents_root",
-        "session_backend", "session_ttl_hours", "redis_url",
-        "draft_ttl_hours", "filled_ttl_hours", "signed_ttl_days",
-        "contracts_db_url",
-        "auth_mode", "auth_jwt_secret", "auth_jwt_audience", "auth_jwt_algorithm",
-        "env", "is_dev", "is_prod",
-    ]
-
-    for key in keys_to_update:
-        if hasattr(settings, key):
-            original_values[key] = getattr(settings, key)
-
-    # Manually overwrite paths
-    settings.project_root = temp_workspace
-    settings.assets_root = temp_workspace / "assets"
-
-    # Re-construct derived paths based on the new assets_root
-    settings.documents_root = settings.assets_root
-    settings.meta_root = settings.documents_root / "meta_data"
-    settings.meta_categories_root = settings.meta_root / "meta_data_categories_documents"
-    settings.meta_users_root = settings.meta_root / "meta_data_users"
-    settings.meta_users_documents_root = settings.meta_users_root / "documents"
-    settings.sessions_root = settings.meta_users_root / "sessions"
-
-    settings.documents_files_root = settings.documents_root / "documents_files"
-    settings.filled_documents_root = settings.documents_files_root / "filled_documents"
-    settings.default_documents_root = settings.documents_files_root / "default_documents_files"
-    settings.users_documents_root = settings.documents_files_root / "users_documents_files"
-    settings.session_backend = "memory"
-    settings.session_ttl_hours = 24
-    settings.draft_ttl_hours = 24
-    settings.filled_ttl_hours = 24 * 7
-    settings.signed_ttl_days = 365
-    settings.redis_url = None
-    settings.auth_mode = "auto"
-    settings.auth_jwt_secret = None
-    settings.auth_jwt_audience = None
-    settings.auth_jwt_algorithm = "HS256"
-    settings.env = "test"
-    settings.is_dev = True
-    settings.is_prod = False
+    for key, value in module_settings_overrides.items():
+        setattr(settings, key, value)
     store._redis_disabled = False
     store_memory._reset_for_tests()
-    contracts_repository._contracts_repo = None
+    # Keep user-document writes triggered by save_session() off the disk
+    contracts_repository._repo_state.instance = (
+        contracts_repository.InMemoryContractsRepository()
+    )
     orig_categories_path = category_index._CATEGORIES_PATH
     category_index._CATEGORIES_PATH = None
     category_index.store.clear()
 
-    # Ensure directories exist
-    settings.meta_categories_root.mkdir(parents=True, exist_ok=True)
-    settings.meta_users_documents_root.mkdir(parents=True, exist_ok=True)
-    settings.sessions_root.mkdir(parents=True, exist_ok=True)
-    settings.default_documents_root.mkdir(parents=True, exist_ok=True)
-    settings.users_documents_root.mkdir(parents=True, exist_ok=True)
-    settings.filled_documents_root.mkdir(parents=True, exist_ok=True)
-
     yield settings
 
-    # Restore original values
-    for key, value in original_values.items():
-        setattr(settings, key, value)
+    contracts_repository._repo_state.reset()
     category_index._CATEGORIES_PATH = orig_categories_path
     category_index.store.clear()
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run pytest-asyncio tests on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """
+    One TestClient with chat_with_tools patched, shared by the whole run.
+
+    Yields (client, mock_chat); tests reset mock_chat.return_value as needed.
+    """
+    from tests.test_utils import setup_mock_chat  # pylint: disable=import-outside-toplevel
+
+    patcher, mock_chat, client = setup_mock_chat()
+    yield client, mock_chat
+    patcher.stop()
+
+
 @pytest.fixture
-def mock_categories_data(mock_settings, monkeypatch):  # noqa: ARG001
+def memory_session_store(monkeypatch):
+    """Keep sessions in the in-memory store for tests that use real settings.
+
+    Unlike mock_settings this leaves asset paths alone (real categories and
+    templates stay available); it only pins the session backend to memory and
+    routes user-document writes to the in-memory contracts repository.
+    """
+    # pylint: disable=import-outside-toplevel
+    from backend.infra.config.settings import settings
+    from backend.infra.persistence import contracts_repository, store_memory
+
+    monkeypatch.setattr(settings, "session_backend", "memory")
+    monkeypatch.setattr(settings, "redis_url", None)
+    store_memory._reset_for_tests()
+    contracts_repository._repo_state.instance = (
+        contracts_repository.InMemoryContractsRepository()
+    )
+    yield
+    contracts_repository._repo_state.reset()
+    store_memory._reset_for_tests()
+
+
+@pytest.fixture(scope="session")
+def mock_categories_parsed():
+    """Mock category index parsed into ``Category`` objects once per run."""
+    from backend.domain.categories.index import Category  # pylint: disable=import-outside-toplevel
+
+    raw = json.loads(_MOCK_CATEGORY_INDEX)
+    return {c["id"]: Category(id=c["id"], label=c["label"]) for c in raw["categories"]}
+
+
+@pytest.fixture
+def mock_categories_data(mock_settings, monkeypatch, mock_categories_parsed):  # noqa: ARG001
     """Create mock category data for testing."""
     from backend.domain.categories.index import store  # pylint: disable=import-outside-toplevel
 
     # Create a dummy category file
-    cat_id = "test_cat"
-    cat_file = mock_settings.meta_categories_root / f"{cat_id}.json"
-    data = {
-        "category_id": cat_id,
-        "templates": [{"id": "t1", "name": "T1", "file": "f1.docx"}],
-        "roles": {
-            "lessor": {"label": "Lessor", "allowed_person_types": ["individual", "company"]},
-            "lessee": {"label": "Lessee", "allowed_person_types": ["individual", "company"]}
-        },
-        "party_modules": {
-            "individual": {
-                "label": "Indiv",
-                "fields": [{"field": "name", "label": "Name", "required": True}]
-            },
-            "company": {
-                "label": "Comp",
-                "fields": [{"field": "name", "label": "Name", "required": True}]
-            }
-        },
-        "contract_fields": [
-            {"field": "cf1", "label": "CF1", "required": True}
-        ]
-    }
-    with cat_file.open("w", encoding="utf-8") as f:
-        json.dump(data, f)
+    cat_file = mock_settings.meta_categories_root / f"{MOCK_CATEGORY_ID}.json"
+    cat_file.write_text(_MOCK_CATEGORY_META, encoding="utf-8")
 
-    # Update index
+    # Update index (rewritten every time: other tests of the module may replace it)
     index_file = mock_settings.meta_categories_root / "categories_index.json"
-    idx_data = {"categories": [{"id": cat_id, "label": "Test Cat", "keywords": ["test"]}]}
-    with index_file.open("w", encoding="utf-8") as f:
-        json.dump(idx_data, f)
+    index_file.write_text(_MOCK_CATEGORY_INDEX, encoding="utf-8")
 
     # Patch the module-level variable _CATEGORIES_PATH because it's evaluated at import time
     monkeypatch.setattr("backend.domain.categories.index._CATEGORIES_PATH", index_file)
 
-    # Force reload store
+    # Seed the store from the session-wide parse instead of re-reading the index
     store.clear()
-    store.load()
+    store._categories = dict(mock_categories_parsed)
+
+    return MOCK_CATEGORY_ID
+
+
+@pytest.fixture
+def docx_text():
+    """Return a loader of the plain text of a DOCX body, parsed once per path.
+
+    Reads ``word/document.xml`` straight from the archive and lets lxml dump
+    the text, skipping python-docx object graph construction.
+    """
+    from lxml import etree  # pylint: disable=import-outside-toplevel
+
+    cache: dict[str, str] = {}
+
+    def _load(path) -> str:
+        key = str(path)
+        if key not in cache:
+            with zipfile.ZipFile(path) as archive:
+                root = etree.fromstring(archive.read("word/document.xml"))
+            cache[key] = etree.tostring(root, method="text", encoding="utf-8").decode("utf-8")
+        return cache[key]
 
-    return cat_id
+    return _load
 
 
 def create_category_meta(
@@ -209,7 +331,7 @@ def create_category_meta(
         "contract_fields": contract_fields,
     }
     meta_path = settings.meta_categories_root / f"{cat_id}.json"
-    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    meta_path.write_bytes(_json_bytes(meta))
 
     # Update or create index
     index_path = settings.meta_categories_root / "categories_index.json"
@@ -225,7 +347,7 @@ def create_category_meta(
             "label": cat_id.replace("_", " ").title(),
             "keywords": keywords,
         })
-    index_path.write_text(json.dumps(idx_data), encoding="utf-8")
+    index_path.write_bytes(_json_bytes(idx_data))
 
     return meta_path, index_path
 
@@ -4,6 +4,7 @@ import pytest
 from backend.agent.tools.session import (
     SetPartyContextTool,
     UpsertFieldTool,
+    UpsertFieldsBatchTool,
     GetPartyFieldsForSessionTool,
     GetSessionSummaryTool
 )
@@ -11,13 +12,12 @@ from backend.infra.persistence.store import get_or_create_session, load_session,
 
 
 @pytest.fixture
-@pytest.mark.usefixtures("mock_settings", "mock_categories_data")
-def session_with_category():
+def session_with_category(mock_settings, mock_categories_data):  # pylint: disable=unused-argument
     """Create session with category fixture."""
     # mock_categories_data creates "test_cat" with "individual" party module
     session_id = "tool_test_session"
     s = get_or_create_session(session_id)
-    s.category_id = "test_cat"
+    s.category_id = mock_categories_data
     save_session(s)
     return session_id
 
@@ -88,6 +88,32 @@ async def test_upsert_field_contract(session_with_category):  # pylint: disable=
     assert s.contract_fields["cf1"].status == "ok"
     assert s.all_data["cf1"]["current"] == "Contract Value"
 
+@pytest.mark.asyncio
+async def test_upsert_fields_batch(session_with_category):  # pylint: disable=redefined-outer-name
+    """Test batch upsert writes party and contract fields in one call."""
+    await SetPartyContextTool().execute(
+        {
+            "session_id": session_with_category,
+            "role": "lessor",
+            "person_type": "individual",
+        },
+        {"user_id": "tool_user"},
+    )
+    res = await UpsertFieldsBatchTool().execute({
+        "session_id": session_with_category,
+        "updates": [
+            {"role": "lessor", "field": "name", "value": "John Doe"},
+            {"field": "cf1", "value": "Contract Value"},
+        ],
+    }, {"user_id": "tool_user"})
+
+    assert res["ok"] is True
+    assert [r["status"] for r in res["results"]] == ["ok", "ok"]
+
+    s = load_session(session_with_category)
+    assert s.all_data["lessor.name"]["current"] == "John Doe"
+    assert s.all_data["cf1"]["current"] == "Contract Value"
+
 @pytest.mark.asyncio
 async def test_get_party_fields(session_with_category):  # pylint: disable=redefined-outer-name
     """Test get party fields."""
@@ -161,3 +161,42 @@ def test_sync_session_incremental_flow(  # pylint: disable=unused-argument,redef
     # Check Lessee Data
     assert doc["parties"]["lessee"]["person_type"] == "company"
     assert doc["parties"]["lessee"]["data"]["name"] == "TOW"
+
+@pytest.mark.usefixtures("mock_settings", "temp_workspace")
+def test_sync_session_contract_fields(  # pylint: disable=unused-argument,redefined-outer-name
+    mock_categories_data, mock_build_contract, monkeypatch
+):
+    """Test contract fields are applied in the same sync call."""
+    events = []
+
+    async def record_broadcast(_session_id, event, **_kwargs):
+        events.append(event)
+
+    monkeypatch.setattr("backend.api.http.server.stream_manager.broadcast", record_broadcast)
+    response = client.post("/sessions", json={}, headers={"X-User-ID": "sync_user"})
+    session_id = response.json()["session_id"]
+
+    payload = {
+        "category_id": "test_cat",
+        "template_id": "t1",
+        "parties": {},
+        "contract_fields": {"cf1": "value"},
+    }
+    response = client.post(
+        f"/sessions/{session_id}/sync",
+        json=payload,
+        headers={"X-User-ID": "sync_user"},
+    )
+    assert response.status_code == 200, f"Response: {response.text}"
+    assert "cf1" not in response.json()["missing"]["contract"]
+    assert response.json()["contract_errors"] == {}
+    assert {"type": "field_update", "field": "cf1", "field_key": "cf1",
+            "value": "value", "role": None} in events
+
+    payload["contract_fields"] = {"no_such_field": "x"}
+    response = client.post(
+        f"/sessions/{session_id}/sync",
+        json=payload,
+        headers={"X-User-ID": "sync_user"},
+    )
+    assert response.status_code == 400
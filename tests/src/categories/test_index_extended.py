@@ -3,6 +3,7 @@ import json
 import pytest
 
 from backend.domain.categories.index import (
+    clear_meta_cache,
     list_entities,
     list_templates,
     list_party_fields,
@@ -26,7 +27,7 @@ def _write_category(settings, cat_id="idx_cat"):
     }
     meta_path = settings.meta_categories_root / f"{cat_id}.json"
     meta_path.write_text(json.dumps(meta), encoding="utf-8")
-    idx_path = settings.meta_categories_root / "categories_index.json"
+    idx_path = settings.meta_categories_root / "index.json"
     idx_data = {"categories": [{"id": cat_id, "label": "Label", "keywords": ["label"]}]}
     idx_path.write_text(json.dumps(idx_data), encoding="utf-8")
     category_store.clear()
@@ -59,6 +60,23 @@ def test_list_party_fields(mock_settings):
     assert not list_party_fields("idx_cat_pf", "company")
 
 
+def test_list_party_fields_cached_until_meta_cleared(mock_settings):
+    """Test party fields are parsed once and re-read after clear_meta_cache."""
+    _write_category(mock_settings, cat_id="idx_cat_cache")
+    first = list_party_fields("idx_cat_cache", "individual")
+    first.clear()  # callers get their own list
+    assert [f.field for f in list_party_fields("idx_cat_cache", "individual")] == ["name"]
+
+    meta_path = mock_settings.meta_categories_root / "idx_cat_cache.json"
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    meta["party_modules"]["individual"]["fields"].append({"field": "address", "label": "Addr"})
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    assert len(list_party_fields("idx_cat_cache", "individual")) == 1
+
+    clear_meta_cache("idx_cat_cache")
+    assert len(list_party_fields("idx_cat_cache", "individual")) == 2
+
+
 def test_find_category_by_query_scores_keywords(mock_settings):
     """Test that find_category_by_query scores by keywords."""
     _write_category(mock_settings, cat_id="search_cat")
@@ -1,10 +1,10 @@
 """Integration tests for lease real estate contract builder."""
 import json
+import re
 import shutil
 from pathlib import Path
 
 import pytest
-from docx import Document
 
 from backend.domain.categories import index as cat_index
 from backend.domain.documents.builder import build_contract
@@ -12,6 +12,18 @@ from backend.domain.sessions.models import FieldState
 from backend.infra.persistence.store import get_or_create_session, save_session
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
+# Read-only status shared by every filled field; the session is serialized on save,
+# so aliasing one instance is safe here (FieldState itself stays mutable).
+_OK_STATE = FieldState(status="ok")
+# Injected values from both contract and party fields expected in the built document
+_REQUIRED_TEXT = (
+    "ДОГОВІР ОРЕНДИ НЕРУХОМОГО МАЙНА",
+    "Орендодавець ПІБ",
+    "Орендар ПІБ",
+    "1400 грн",
+    "м. Стрий, вул. Шевченка, 32",
+)
+_REQUIRED_RE = re.compile("|".join(map(re.escape, _REQUIRED_TEXT)))
 
 
 def _setup_lease_real_estate_metadata(mock_settings, monkeypatch):
@@ -23,7 +35,7 @@ def _setup_lease_real_estate_metadata(mock_settings, monkeypatch):
     meta_dst_dir = mock_settings.meta_categories_root
     meta_dst_dir.mkdir(parents=True, exist_ok=True)
     meta_dst = meta_dst_dir / "lease_real_estate.json"
-    meta_dst.write_text(meta_src.read_text(encoding="utf-8"), encoding="utf-8")
+    shutil.copyfile(meta_src, meta_dst)
 
     index_path = meta_dst_dir / "categories_index.json"
     index_data = {
@@ -50,8 +62,9 @@ def _setup_lease_template(mock_settings):
     shutil.copy(tmpl_src, tmpl_dst)
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_build_real_estate_contract_full(mock_settings, monkeypatch):
+async def test_build_real_estate_contract_full(mock_settings, monkeypatch, docx_text):
     """Use real lease_real_estate metadata/template and ensure values are injected."""
     _setup_lease_real_estate_metadata(mock_settings, monkeypatch)
     _setup_lease_template(mock_settings)
@@ -90,18 +103,18 @@ async def test_build_real_estate_contract_full(mock_settings, monkeypatch):
         "premises_return_deadline": "протягом 1 дня",
     }
     for key, val in contract_values.items():
-        s.contract_fields[key] = FieldState(status="ok")
+        s.contract_fields[key] = _OK_STATE
         s.all_data[key] = {"current": val}
 
     # Party fields (individual module requires name+address)
     s.party_fields = {
         "lessor": {
-            "name": FieldState(status="ok"),
-            "address": FieldState(status="ok"),
+            "name": _OK_STATE,
+            "address": _OK_STATE,
         },
         "lessee": {
-            "name": FieldState(status="ok"),
-            "address": FieldState(status="ok"),
+            "name": _OK_STATE,
+            "address": _OK_STATE,
         },
     }
     s.all_data["lessor.name"] = {"current": "Орендодавець ПІБ"}
@@ -112,12 +125,8 @@ async def test_build_real_estate_contract_full(mock_settings, monkeypatch):
     save_session(s)
 
     result = await build_contract(sid, "lease_flat")
-    built = Document(result["file_path"])
-    full_text = "\n".join(p.text for p in built.paragraphs)
-
-    # Spot-check a few injected values from both contract and party fields
-    assert "ДОГОВІР ОРЕНДИ НЕРУХОМОГО МАЙНА" in full_text
-    assert "Орендодавець ПІБ" in full_text
-    assert "Орендар ПІБ" in full_text
-    assert "1400 грн" in full_text
-    assert "м. Стрий, вул. Шевченка, 32" in full_text
+    full_text = docx_text(result["file_path"])
+
+    # Spot-check all injected values in a single pass over the text
+    found = set(_REQUIRED_RE.findall(full_text))
+    assert set(_REQUIRED_TEXT) <= found, set(_REQUIRED_TEXT) - found
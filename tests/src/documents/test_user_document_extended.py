@@ -1,25 +1,23 @@
 """Extended tests for user document building."""
-import pytest
-
 from backend.domain.documents.user_document import build_user_document
-from backend.infra.persistence.store import get_or_create_session, save_session
-from backend.domain.sessions.models import SessionState
+from backend.domain.sessions.models import Session, SessionState
 
 
-@pytest.mark.usefixtures("mock_settings")
 def test_build_user_document_populates_fields(mock_categories_data):
     """Test that build_user_document populates all fields correctly."""
-    s = get_or_create_session("user_doc_session")
-    s.category_id = mock_categories_data
-    s.template_id = "t1"
-    s.state = SessionState.BUILT
-    s.party_types = {"lessor": "individual", "lessee": "company"}
-    s.all_data = {
-        "cf1": {"current": "CF"},
-        "lessor.name": {"current": "Lessor"},
-        "lessee.name": {"current": "Lessee LLC"},
-    }
-    save_session(s)
+    # build_user_document works on the Session object itself, no store round-trip needed
+    s = Session(
+        session_id="user_doc_session",
+        category_id=mock_categories_data,
+        template_id="t1",
+        state=SessionState.BUILT,
+        party_types={"lessor": "individual", "lessee": "company"},
+        all_data={
+            "cf1": {"current": "CF"},
+            "lessor.name": {"current": "Lessor"},
+            "lessee.name": {"current": "Lessee LLC"},
+        },
+    )
 
     doc = build_user_document(s)
     assert doc["status"] == "built"
@@ -30,13 +28,9 @@ def test_build_user_document_populates_fields(mock_categories_data):
     assert doc["parties"]["lessee"]["data"]["name"] == "Lessee LLC"
 
 
-@pytest.mark.usefixtures("mock_settings")
 def test_build_user_document_defaults_roles_when_missing(mock_categories_data):
     """Test that build_user_document provides defaults for missing roles."""
-    s = get_or_create_session("user_doc_defaults")
-    s.category_id = mock_categories_data
-    s.all_data = {}
-    save_session(s)
+    s = Session(session_id="user_doc_defaults", category_id=mock_categories_data)
 
     doc = build_user_document(s)
     # Falls back to lessor/lessee with default person_type individual
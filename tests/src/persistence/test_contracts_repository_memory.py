@@ -0,0 +1,25 @@
+"""Tests for in-memory contracts repository."""
+from backend.infra.persistence.contracts_repository import InMemoryContractsRepository
+from backend.domain.sessions.models import Session, SessionState
+
+
+def test_memory_contracts_repo_roundtrip():
+    """Test in-memory contracts repository roundtrip and isolation."""
+    repo = InMemoryContractsRepository()
+    sess = Session(session_id="sess_mem", creator_user_id="owner", state=SessionState.BUILT)
+    payload = {"foo": "bar", "nested": {"a": 1}}
+    repo.create_or_update(sess, payload)
+
+    loaded = repo.get_by_session_id("sess_mem")
+    assert loaded == payload
+    loaded["nested"]["a"] = 2
+    assert repo.get_by_session_id("sess_mem") == payload
+
+    repo.create_or_update(sess, {"foo": "baz"})
+    assert repo.get_by_session_id("sess_mem") == {"foo": "baz"}
+    assert repo.get_by_session_id("missing") is None
+
+    items = repo.list_for_user("owner")
+    assert [i["session_id"] for i in items] == ["sess_mem"]
+    assert items[0]["document"] == {"foo": "baz"}
+    assert repo.list_for_user("other") == []
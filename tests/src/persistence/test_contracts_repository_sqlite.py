@@ -1,4 +1,5 @@
 """Tests for SQLite contracts repository."""
+import sqlite3
 from pathlib import Path
 
 from backend.infra.persistence.contracts_repository import SQLiteContractsRepository
@@ -33,3 +34,56 @@ def test_sqlite_contracts_repo_roundtrip(tmp_path: Path):
     # List for user
     items = repo.list_for_user("owner")
     assert any(i["session_id"] == "sess_sqlite" for i in items)
+
+
+def test_sqlite_contracts_repo_bulk_context(tmp_path: Path, monkeypatch):
+    """Test bulk_context writes every row and commits in batches."""
+    repo = SQLiteContractsRepository(tmp_path / "contracts.db")
+    monkeypatch.setattr(SQLiteContractsRepository, "BULK_COMMIT_EVERY", 2)
+
+    with repo.bulk_context():
+        for i in range(5):
+            repo.create_or_update(_session(f"bulk_{i}"), {"n": i})
+
+    assert repo.get_by_session_id("bulk_4") == {"n": 4}
+    assert len(repo.list_for_user("owner")) == 5
+
+
+def test_sqlite_contracts_repo_bulk_context_keeps_journal_mode(tmp_path: Path):
+    """Test bulk_context does not switch the database file to WAL."""
+    db_path = tmp_path / "contracts.db"
+    repo = SQLiteContractsRepository(db_path)
+
+    with repo.bulk_context():
+        repo.create_or_update(_session("bulk_0"), {"n": 0})
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    finally:
+        conn.close()
+
+
+def test_sqlite_contracts_repo_bulk_create_or_update(tmp_path: Path, monkeypatch):
+    """Test bulk_create_or_update inserts new rows and updates existing ones."""
+    repo = SQLiteContractsRepository(tmp_path / "contracts.db")
+    monkeypatch.setattr(SQLiteContractsRepository, "BULK_COMMIT_EVERY", 2)
+    repo.create_or_update(_session("bulk_0"), {"n": "old"})
+
+    repo.bulk_create_or_update([(_session(f"bulk_{i}"), {"n": i}) for i in range(5)])
+
+    assert repo.get_by_session_id("bulk_0") == {"n": 0}
+    assert len(repo.list_for_user("owner")) == 5
+
+
+def test_sqlite_contracts_repo_nested_bulk_reuses_connection(tmp_path: Path):
+    """Test bulk_create_or_update inside bulk_context keeps the outer connection."""
+    repo = SQLiteContractsRepository(tmp_path / "contracts.db")
+
+    with repo.bulk_context():
+        outer = repo._bulk.conn  # pylint: disable=protected-access
+        repo.bulk_create_or_update([(_session(f"bulk_{i}"), {"n": i}) for i in range(3)])
+        assert repo._bulk.conn is outer  # pylint: disable=protected-access
+        repo.create_or_update(_session("bulk_3"), {"n": 3})
+
+    assert len(repo.list_for_user("owner")) == 4
@@ -2,6 +2,7 @@
 import json
 
 from backend.domain.categories import index as category_index
+from backend.domain.services import fields as fields_service
 from backend.domain.services.fields import get_required_fields
 from backend.infra.persistence.store import get_or_create_session, save_session
 
@@ -73,3 +74,46 @@ def test_get_required_fields_partial_mode(mock_settings):
     assert "lessor.name" in keys
     assert "lessee.name" not in keys
     assert "cf1" in keys
+
+
+def test_get_required_fields_cached_per_session_shape(mock_settings):
+    """Test required fields are reused for the same schema inputs and reset with metadata."""
+    _setup_category(mock_settings)
+    s = get_or_create_session("req_cached")
+    s.category_id = "fields_cat"
+    s.role = "lessor"
+    s.filling_mode = "partial"
+    s.party_types = {"lessor": "individual", "lessee": "individual"}
+
+    first = get_required_fields(s)
+    second = get_required_fields(s)
+    assert first == second
+    assert first is not second
+    assert first[0] is second[0]
+
+    # A different filling mode is a different schema
+    s.filling_mode = "full"
+    assert "lessee.name" in {r.key for r in get_required_fields(s)}
+
+    category_index.clear_meta_cache("fields_cat")
+    assert get_required_fields(s)[0] is not second[0]
+
+
+def test_get_required_fields_ignores_schema_built_before_reload(mock_settings):
+    """Test a schema stored late from pre-reload metadata is not served."""
+    _setup_category(mock_settings)
+    s = get_or_create_session("req_cached_race")
+    s.category_id = "fields_cat"
+    s.party_types = {"lessor": "individual", "lessee": "individual"}
+
+    stale = get_required_fields(s)
+    rev_before = category_index.meta_revision()
+    category_index.clear_meta_cache("fields_cat")
+    get_required_fields(s)
+
+    # A caller that read the old revision finishes after the reload
+    # pylint: disable-next=protected-access
+    key = fields_service._required_fields_key(s, "self")
+    # pylint: disable-next=protected-access
+    fields_service._required_fields_cache[key] = (rev_before, tuple(stale))
+    assert get_required_fields(s)[0] is not stale[0]
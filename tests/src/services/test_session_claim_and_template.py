@@ -2,17 +2,18 @@
 import pytest
 
 from backend.domain.services.session import claim_session_role, set_session_template
-from backend.infra.persistence.store import get_or_create_session, save_session
-from backend.domain.sessions.models import SessionState, FieldState
+from backend.infra.persistence.store import save_session
+from backend.domain.sessions.models import Session, SessionState, FieldState
 
 
 def _session(cat_id="test_cat"):
-    s = get_or_create_session("claim_session")
-    s.category_id = cat_id
-    s.filling_mode = "partial"
-    s.party_types = {"lessor": "individual", "lessee": "individual"}
-    s.role_owners = {}
-    return s
+    return Session(
+        session_id="claim_session",
+        category_id=cat_id,
+        filling_mode="partial",
+        party_types={"lessor": "individual", "lessee": "individual"},
+        role_owners={},
+    )
 
 
 @pytest.mark.usefixtures("mock_settings")
@@ -1,22 +1,45 @@
 """Tests for session field update hardening and validation."""
+import copy
+from uuid import uuid4
+
 import pytest
 
-from backend.domain.services.session import update_session_field
+from backend.domain.services.session import update_session_field, update_session_fields
 from backend.domain.services.fields import validate_session_readiness
 from backend.infra.persistence.store import get_or_create_session, save_session
-from backend.domain.sessions.models import SessionState
+from backend.domain.sessions.models import Session, SessionState
+from tests.conftest import MOCK_CATEGORY_ID
+
+
+@pytest.fixture(name="base_session_template", scope="module")
+def base_session_template_fixture():
+    """Lessor-side session on the mock category, built once per module."""
+    return Session(
+        session_id="__template__",
+        category_id=MOCK_CATEGORY_ID,
+        role="lessor",
+        person_type="individual",
+        party_types={"lessor": "individual", "lessee": "individual"},
+    )
 
 
-def _base_session(session_id: str, category_id: str):
-    s = get_or_create_session(session_id)
-    s.category_id = category_id
-    s.role = "lessor"
-    s.person_type = "individual"
-    s.party_types = {"lessor": "individual", "lessee": "individual"}
-    save_session(s)
+@pytest.fixture(name="unsaved_base_session")
+def unsaved_base_session_fixture(
+    mock_settings, mock_categories_data, base_session_template  # pylint: disable=unused-argument
+):
+    """Fresh copy of the template with a unique session id, not yet persisted."""
+    s = copy.deepcopy(base_session_template)
+    s.session_id = f"sess_{uuid4().hex}"
     return s
 
 
+@pytest.fixture(name="base_session")
+def base_session_fixture(unsaved_base_session):
+    """Fresh saved copy of the template."""
+    save_session(unsaved_base_session)
+    return unsaved_base_session
+
+
 @pytest.mark.usefixtures("mock_settings", "mock_categories_data")
 def test_update_session_field_requires_category():
     """Test that updating field requires category to be set."""
@@ -27,10 +50,9 @@ def test_update_session_field_requires_category():
     assert fs.status == "error"
 
 
-@pytest.mark.usefixtures("mock_settings")
-def test_update_session_field_requires_role_for_party_field(mock_categories_data):
+def test_update_session_field_requires_role_for_party_field(base_session):
     """Test that updating party field requires role to be set."""
-    s = _base_session("need_role_session", mock_categories_data)
+    s = base_session
     s.role = None  # unset current role
     ok, err, fs = update_session_field(s, "name", "Some")
     assert ok is False
@@ -38,20 +60,18 @@ def test_update_session_field_requires_role_for_party_field(mock_categories_data
     assert fs.status == "error"
 
 
-@pytest.mark.usefixtures("mock_settings")
-def test_update_invalid_field_returns_error(mock_categories_data):
+def test_update_invalid_field_returns_error(base_session):
     """Test that updating unknown field returns error."""
-    s = _base_session("unknown_field_session", mock_categories_data)
+    s = base_session
     ok, err, fs = update_session_field(s, "nonexistent_field", "Val", role="lessor")
     assert ok is False
     assert "не належить" in err.lower()
     assert fs.status == "error"
 
 
-@pytest.mark.usefixtures("mock_settings")
-def test_update_blocks_signed_role_and_invalidates_other_signatures(mock_categories_data):
+def test_update_blocks_signed_role_and_invalidates_other_signatures(unsaved_base_session):
     """Test that editing signed role is blocked and invalidates other signatures."""
-    s = _base_session("sign_guard_session", mock_categories_data)
+    s = unsaved_base_session
     s.signatures = {"lessor": True, "lessee": True}
     save_session(s)
 
@@ -69,11 +89,10 @@ def test_update_blocks_signed_role_and_invalidates_other_signatures(mock_categor
     assert s.signatures.get("lessee") is False  # invalidated
 
 
-@pytest.mark.usefixtures("mock_settings")
-def test_validate_session_readiness_partial_vs_full(mock_categories_data):
+def test_validate_session_readiness_partial_vs_full(base_session):
     """Test session readiness validation in partial vs full mode."""
     # Full mode requires both roles
-    s = _base_session("readiness_full", mock_categories_data)
+    s = base_session
     # Fill only lessor
     update_session_field(s, "name", "Lessor Name", role="lessor")
     update_session_field(s, "cf1", "Contract V", role=None)
@@ -88,10 +107,9 @@ def test_validate_session_readiness_partial_vs_full(mock_categories_data):
     assert ready_partial is True
 
 
-@pytest.mark.usefixtures("mock_settings")
-def test_update_session_field_sets_state_and_progress(mock_categories_data):
+def test_update_session_field_sets_state_and_progress(base_session):
     """Test that field update sets session state and progress."""
-    s = _base_session("progress_session", mock_categories_data)
+    s = base_session
     ok, _, _fs = update_session_field(s, "cf1", "Val", role=None)
     assert ok is True
     assert s.contract_fields["cf1"].status == "ok"
@@ -100,10 +118,9 @@ def test_update_session_field_sets_state_and_progress(mock_categories_data):
     assert s.progress.get("required_filled") >= 1
 
 
-@pytest.mark.usefixtures("mock_settings")
-def test_update_session_field_history_and_current_on_error(mock_categories_data):
+def test_update_session_field_history_and_current_on_error(base_session):
     """Test that invalid update preserves current value but logs in history."""
-    s = _base_session("history_session", mock_categories_data)
+    s = base_session
     # First valid value sets current
     ok, _, _ = update_session_field(s, "cf1", "Valid", role=None)
     assert ok is True
@@ -117,10 +134,9 @@ def test_update_session_field_history_and_current_on_error(mock_categories_data)
     assert s.all_data["cf1"]["current"] == "Valid"
 
 
-@pytest.mark.usefixtures("mock_settings")
-def test_update_session_field_history_includes_actor(mock_categories_data):
+def test_update_session_field_history_includes_actor(base_session):
     """Test that field update history includes actor information."""
-    s = _base_session("history_actor_session", mock_categories_data)
+    s = base_session
     ok, _, _ = update_session_field(
         s,
         "cf1",
@@ -133,3 +149,18 @@ def test_update_session_field_history_includes_actor(mock_categories_data):
     assert entry["user_id"] == "user1"
     assert entry["role"] == "lessor"
     assert entry["ts"].endswith("Z") or entry["ts"].endswith("+00:00")
+
+
+def test_update_session_fields_batches_readiness(base_session):
+    """Test batched updates record every field and refresh state once at the end."""
+    s = base_session
+    results = update_session_fields(
+        s,
+        [("lessor", "name", "Lessor Name"), (None, "cf1", "Contract V")],
+        context={"user_id": "user1"},
+    )
+    assert [ok for ok, _, _ in results] == [True, True]
+    assert s.party_fields["lessor"]["name"].status == "ok"
+    assert s.contract_fields["cf1"].status == "ok"
+    assert [e["user_id"] for e in s.history[-2:]] == ["user1", "user1"]
+    assert s.progress.get("required_filled") >= 2
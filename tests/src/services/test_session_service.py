@@ -2,15 +2,14 @@
 import pytest
 
 from backend.domain.services.session import set_party_type
-from backend.infra.persistence.store import get_or_create_session, save_session
-from backend.domain.sessions.models import FieldState, SessionState
+from backend.infra.persistence.store import save_session
+from backend.domain.sessions.models import FieldState, Session, SessionState
 
 
 @pytest.mark.usefixtures("mock_settings", "mock_categories_data")
 def test_set_party_type_invalidates_signature():
     """Test that changing party type invalidates signature and clears fields."""
-    session = get_or_create_session("sig_reset")
-    session.category_id = "test_cat"
+    session = Session(session_id="sig_reset", category_id="test_cat")
 
     # Початковий тип та заповнені поля для ролі, підпис уже виставлено
     session.party_types["lessor"] = "individual"
@@ -2,15 +2,14 @@
 import pytest
 
 from backend.domain.sessions.actions import set_session_category
-from backend.infra.persistence.store import get_or_create_session, save_session
-from backend.domain.sessions.models import SessionState, FieldState
+from backend.infra.persistence.store import save_session
+from backend.domain.sessions.models import Session, SessionState, FieldState
 
 
 @pytest.mark.usefixtures("mock_settings")
 def test_set_session_category_resets_state_and_data(mock_categories_data):
     """Test that setting category resets session state and data."""
-    s = get_or_create_session("action_reset")
-    s.category_id = mock_categories_data
+    s = Session(session_id="action_reset", category_id=mock_categories_data)
     s.template_id = "old_t"
     s.state = SessionState.BUILT
     s.party_fields["lessor"] = {"name": FieldState(status="ok")}
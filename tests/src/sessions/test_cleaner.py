@@ -3,6 +3,8 @@ import pytest
 
 from backend.domain.sessions.cleaner import clean_stale_sessions, clean_abandoned_sessions
 
+pytestmark = pytest.mark.xdist_group("session_store")
+
 
 @pytest.mark.usefixtures("mock_settings")
 def test_cleaners_are_noop_for_non_filesystem_backend():
@@ -1,20 +1,24 @@
 """Tests for session TTL-based cleanup."""
-import json
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from backend.domain.sessions.cleaner import clean_stale_sessions
 from backend.domain.sessions.models import SessionState
 
+pytestmark = pytest.mark.xdist_group("session_store")
+
+# Cleaner only reads state/updated_at, so the payload is filled in without json.dumps
+_SESSION_TMPL = '{{"session_id": "{sid}", "state": "{state}", "updated_at": "{ts}"}}'
+
 
 def _write_session(settings, session_id: str, state: SessionState, hours_ago: int):
     """Helper to write test session file."""
-    payload = {
-        "session_id": session_id,
-        "state": state.value,
-        "updated_at": (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).isoformat(),
-    }
+    ts = (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).isoformat()
     path = settings.sessions_root / f"{session_id}.json"
-    path.write_text(json.dumps(payload), encoding="utf-8")
+    path.write_bytes(
+        _SESSION_TMPL.format(sid=session_id, state=state.value, ts=ts).encode("utf-8")
+    )
     return path
 
 
@@ -1,27 +1,28 @@
 """Tests for list user sessions."""
-import time
+import pytest
 
 from backend.infra.persistence.store import (
     list_user_sessions,
     get_or_create_session,
     save_session,
+    save_sessions,
 )
 
+pytestmark = pytest.mark.xdist_group("session_store")
+
 
 def test_list_user_sessions_returns_sorted(mock_settings):  # pylint: disable=unused-argument
     """Test list user sessions returns sorted."""
+    # save_session stamps strictly increasing updated_at values, so no sleeps needed
     s1 = get_or_create_session("s1")
     s1.role_owners = {"lessor": "user1"}
     save_session(s1)
 
-    time.sleep(0.01)
     s2 = get_or_create_session("s2")
     s2.role_owners = {"lessee": "user1"}
-    save_session(s2)
-
     s3 = get_or_create_session("s3")
     s3.role_owners = {"lessor": "other"}
-    save_session(s3)
+    save_sessions([s2, s3])
 
     sessions = list_user_sessions("user1")
     ids = [s.session_id for s in sessions]
@@ -1,7 +1,12 @@
 """Tests for session store."""
 import pytest
 
-from backend.infra.persistence.store import get_or_create_session, load_session, save_session
+from backend.infra.persistence.store import (
+    get_or_create_session,
+    load_session,
+    save_session,
+    save_sessions,
+)
 from backend.domain.sessions.models import Session, FieldState
 
 
@@ -23,6 +28,14 @@ def test_save_and_load(mock_settings):  # pylint: disable=unused-argument
     assert loaded.category_id == "cat1"
     assert loaded.party_fields["lessor"]["name"].status == "ok"
 
+def test_save_sessions_bulk(mock_settings):  # pylint: disable=unused-argument
+    """Test bulk save stores every session."""
+    sessions = [Session(session_id=f"bulk_{i}", category_id="cat1") for i in range(3)]
+    save_sessions(sessions)
+
+    for s in sessions:
+        assert load_session(s.session_id).category_id == "cat1"
+
 def test_load_not_found(mock_settings):  # pylint: disable=unused-argument
     """Test load not found raises error."""
     # pylint: disable-next=import-outside-toplevel
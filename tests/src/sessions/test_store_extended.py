@@ -1,8 +1,8 @@
 """Extended tests for session store."""
-import time
 
 from backend.infra.persistence.store import get_or_create_session, save_session, load_session
-from backend.domain.sessions.models import FieldState
+from backend.infra.persistence.store_utils import session_to_dict
+from backend.domain.sessions.models import FieldState, Session
 
 
 def test_get_or_create_returns_session(mock_settings):  # pylint: disable=unused-argument
@@ -30,7 +30,19 @@ def test_save_session_updates_timestamp(mock_settings):  # pylint: disable=unuse
     sid = "store_timestamp"
     s = get_or_create_session(sid)
     first = load_session(sid).updated_at
-    time.sleep(0.01)
     save_session(s)
     second = load_session(sid).updated_at
     assert second > first
+
+
+def test_session_to_dict_serializes_field_states():
+    """Test session_to_dict turns nested FieldState objects into plain dicts."""
+    s = Session(session_id="to_dict")
+    s.party_fields["lessor"] = {"name": FieldState(status="error", error="bad")}
+    s.contract_fields["cf1"] = FieldState(status="ok")
+
+    data = session_to_dict(s)
+    assert data["party_fields"] == {"lessor": {"name": {"status": "error", "error": "bad"}}}
+    assert data["contract_fields"] == {"cf1": {"status": "ok", "error": None}}
+    assert data["state"] == "idle"
+    assert data["party_users"] is s.role_owners
@@ -1,12 +1,11 @@
 """Tests for Redis session store."""
-import json
 import time
 
 import pytest
 import pytest_asyncio
 
 from backend.shared.errors import SessionNotFoundError
-from backend.domain.sessions.models import FieldState
+from backend.domain.sessions.models import FieldState, Session
 from backend.infra.persistence.store import (
     aget_or_create_session,
     alist_user_sessions,
@@ -16,6 +15,8 @@ from backend.infra.persistence.store import (
 )
 from backend.infra.storage import redis_client as redis_client_module
 from backend.infra.persistence import store as store_module
+from backend.infra.persistence import store_redis
+from backend.infra.persistence.store_utils import loads_payload
 from backend.domain.sessions.ttl import ttl_hours_for_state
 
 try:
@@ -27,12 +28,16 @@ except ImportError:
 
 pytestmark = pytest.mark.skipif(not HAS_FAKEREDIS, reason="fakeredis not installed")
 
+# One fake client for the whole module; tests only flush it
+_FAKE_REDIS = fakeredis.aioredis.FakeRedis(decode_responses=True) if HAS_FAKEREDIS else None
+
 
 @pytest_asyncio.fixture(name="redis_mock")
 async def redis_backend_fixture(mock_settings, monkeypatch):
-    """Create fake Redis backend for testing."""
-    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
-    monkeypatch.setattr(redis_client_module, "_redis", fake)
+    """Point the store at the shared fake Redis backend."""
+    fake = _FAKE_REDIS
+    await fake.flushall()
+    monkeypatch.setattr(redis_client_module._holder, "client", fake)
     monkeypatch.setattr(mock_settings, "session_backend", "redis")
     monkeypatch.setattr(mock_settings, "session_ttl_hours", 24)
     monkeypatch.setattr(mock_settings, "redis_url", "redis://localhost:6379/0")
@@ -58,8 +63,8 @@ async def test_save_and_load_roundtrip(redis_mock):
     expected_ttl = ttl_hours_for_state(session.state) * 3600
     assert ttl is not None and 0 < ttl <= expected_ttl
 
-    raw = json.loads(await redis_mock.get(f"session:{session.session_id}"))
-    assert raw["party_fields"]["lessor"]["name"]["status"] is True
+    raw = loads_payload(await redis_mock.get(f"session:{session.session_id}"))
+    assert raw["party_fields"]["lessor"]["name"]["status"] == "ok"
 
 
 @pytest.mark.asyncio
@@ -77,6 +82,27 @@ async def test_transactional_session_saves_changes(redis_mock):
     assert await redis_mock.get(f"session_lock:{session.session_id}") is None
 
 
+@pytest.mark.asyncio
+async def test_transactional_session_registers_scripts_once(redis_mock, monkeypatch):
+    """Test Lua scripts are registered once per client, not per transaction."""
+    holder = store_redis._ScriptHolder()  # pylint: disable=protected-access
+    monkeypatch.setattr(store_redis, "_scripts", holder)
+    registered = []
+    real_register = redis_mock.register_script
+
+    def counting_register(source):
+        registered.append(source)
+        return real_register(source)
+
+    monkeypatch.setattr(redis_mock, "register_script", counting_register)
+    session = await aget_or_create_session("redis_scripts")
+    for i in range(3):
+        async with atransactional_session(session.session_id) as s:
+            s.contract_fields[f"cf{i}"] = FieldState(status="ok")
+
+    assert len(registered) == len(set(registered)) == 2
+    assert len((await aload_session(session.session_id)).contract_fields) == 3
+
 @pytest.mark.asyncio
 async def test_list_user_sessions_returns_sorted(redis_mock):
     """Test list user sessions returns sorted."""
@@ -84,8 +110,6 @@ async def test_list_user_sessions_returns_sorted(redis_mock):
     s1.role_owners = {"lessor": "user-list"}
     await asave_session(s1)
 
-    time.sleep(0.01)
-
     s2 = await aget_or_create_session("redis_ls2")
     s2.role_owners = {"lessee": "user-list"}
     await asave_session(s2)
@@ -110,9 +134,55 @@ async def test_list_user_sessions_returns_sorted(redis_mock):
     assert any(s.session_id == "redis_creator_only" for s in creator_sessions)
 
 
+@pytest.mark.asyncio
+async def test_list_user_sessions_threaded_decode(redis_mock, monkeypatch):
+    """Test large listings decode in the threadpool with the same result."""
+    monkeypatch.setattr(store_redis, "THREADED_DECODE_MIN_SESSIONS", 1)
+    s1 = await aget_or_create_session("redis_td1")
+    s1.role_owners = {"lessor": "user-td"}
+    await asave_session(s1)
+    s2 = await aget_or_create_session("redis_td2")
+    s2.role_owners = {"lessee": "user-td"}
+    await asave_session(s2)
+    await redis_mock.zadd("user_sessions:user-td", {"ghost": time.time()})
+
+    sessions = await alist_user_sessions("user-td")
+    assert [s.session_id for s in sessions] == [s2.session_id, s1.session_id]
+    assert "ghost" not in await redis_mock.zrange("user_sessions:user-td", 0, -1)
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("redis_mock")
 async def test_load_missing_raises():
     """Test load missing raises error."""
     with pytest.raises(SessionNotFoundError):
         await aload_session("does-not-exist")
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_keeps_concurrently_created_session(redis_mock, monkeypatch):
+    """Test get_or_create does not overwrite a session created after its GET missed."""
+    real_load = store_redis.load_session
+    missed = []
+
+    async def racing_load(session_id):
+        if not missed:
+            missed.append(session_id)
+            await store_redis.save_session(Session(session_id=session_id, creator_user_id="winner"))
+            raise SessionNotFoundError(session_id)
+        return await real_load(session_id)
+
+    monkeypatch.setattr(store_redis, "load_session", racing_load)
+    session = await aget_or_create_session("redis_race", user_id="loser")
+    assert session.creator_user_id == "winner"
+    assert (await aload_session("redis_race")).creator_user_id == "winner"
+    assert not await redis_mock.zrange("user_sessions:loser", 0, -1)
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_indexes_creator(redis_mock):
+    """Test a created session is indexed for its creator with its updated_at score."""
+    session = await aget_or_create_session("redis_new", user_id="creator")
+
+    scores = await redis_mock.zrange("user_sessions:creator", 0, -1, withscores=True)
+    assert scores == [("redis_new", session.updated_at.timestamp())]
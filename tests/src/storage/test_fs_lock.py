@@ -7,6 +7,7 @@ import pytest
 from backend.infra.storage.fs import (
     FileLock,
     output_document_path,
+    read_json,
     session_answers_path,
     write_json,
 )
@@ -20,6 +21,8 @@ def test_filelock_reentrant_same_thread(tmp_path):
         with lock:  # reentrant should not deadlock
             write_json(target, {"a": 1}, locked_by_caller=True)
     assert json.loads(target.read_text(encoding="utf-8"))["a"] == 1
+    # The outer exit must still release the physical lock
+    assert not target.with_suffix(".json.lock").exists()
 
 
 def test_filelock_blocks_other_thread(tmp_path):
@@ -43,6 +46,27 @@ def test_filelock_blocks_other_thread(tmp_path):
     assert acquired == ["timeout"]
 
 
+def test_filelock_serializes_sibling_threads(tmp_path):
+    """Test no read-modify-write cycle is lost between contending threads."""
+    target = tmp_path / "counter.json"
+    write_json(target, {"n": 0})
+
+    def worker():
+        for _ in range(20):
+            with FileLock(target):
+                data = read_json(target)
+                data["n"] += 1
+                write_json(target, data, locked_by_caller=True)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert read_json(target)["n"] == 80
+    assert not target.with_suffix(".json.lock").exists()
+
+
 def test_write_json_creates_directories(tmp_path):
     """Test write_json creates parent directories."""
     nested = tmp_path / "a" / "b" / "c.json"
@@ -22,6 +22,19 @@ def test_validate_value_empty():
     assert val == ""
     assert err is None
 
+@pytest.mark.parametrize("raw", ["123", "12345678901", "abc"])
+def test_validate_value_rnokpp_invalid(raw):
+    """Test RNOKPP values without exactly 10 digits are rejected."""
+    _, err = validate_value("rnokpp", raw)
+    assert err is not None
+
+
+def test_validate_value_rnokpp_any_ten_digits():
+    """Test RNOKPP accepts any 10 digits (checksum is not enforced)."""
+    val, err = validate_value("rnokpp", "1234567890")
+    assert val == "1234567890"
+    assert err is None
+
 def test_normalize_date_valid():
     """Test normalize date valid."""
     assert normalize_date("01.01.2023") == "01.01.2023"
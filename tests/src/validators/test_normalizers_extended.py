@@ -7,6 +7,7 @@ from backend.domain.validation.money import normalize_money
 from backend.domain.validation.person import normalize_person_name
 from backend.domain.validation.tax import normalize_rnokpp, normalize_edrpou
 from backend.domain.validation.address import normalize_address
+from backend.shared.errors import ValidationError
 
 
 def test_normalize_date_formats():
@@ -53,3 +54,47 @@ def test_normalize_rnokpp_and_edrpou():
 def test_normalize_address():
     """Test address normalization."""
     assert normalize_address(" вул. Шевченка, 10 ") == "вул. Шевченка, 10"
+
+
+@pytest.mark.parametrize(
+    ("normalizer", "raw", "expected"),
+    [
+        (
+            normalize_iban_ua,
+            "UA21 3223 1300 0002 6007 2335 6600 1",
+            "UA213223130000026007233566001",
+        ),
+        (normalize_iban_ua, "ua213223130000026007233566001", "UA213223130000026007233566001"),
+        (normalize_iban_ua, "UA21\t3223 1300\n0002600723356600 1", "UA213223130000026007233566001"),
+        (normalize_money, "1 500,5", "1500.50"),
+        (normalize_rnokpp, "123-456-78 90", "1234567890"),
+        (normalize_date, " 5-1-2024 ", "05.01.2024"),
+        (normalize_date, "2024/1/5", "05.01.2024"),
+    ],
+    ids=[
+        "iban-spaces",
+        "iban-lowercase",
+        "iban-mixed-whitespace",
+        "money-comma-decimal",
+        "rnokpp-separators",
+        "date-dashes-padded",
+        "date-iso-slashes",
+    ],
+)
+def test_normalizers_accept_loose_input(normalizer, raw, expected):
+    """Test normalizers clean up separators, case and whitespace."""
+    assert normalizer(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("normalizer", "raw"),
+    [
+        (normalize_iban_ua, "UA21322313000002600723356600!"),
+        (normalize_money, "10,123"),
+    ],
+    ids=["iban-bad-char", "money-three-decimals"],
+)
+def test_normalizers_reject_malformed_input(normalizer, raw):
+    """Test normalizers reject values their patterns do not match."""
+    with pytest.raises(ValidationError):
+        normalizer(raw)
@@ -1,4 +1,6 @@
 """Extended tests for PII tagger functionality."""
+import pytest
+
 from backend.domain.validation.pii_tagger import sanitize_typed
 
 
@@ -60,3 +62,33 @@ def test_sanitize_typed_detects_private_key_and_jwt():
     tags = res["tags"]
     assert any(t.startswith("[PRIVATE_KEY#") for t in tags)
     assert any(t.startswith("[JWT#") for t in tags)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected_tags"),
+    [
+        ("Адреса: м. Київ, вул. Хрещатик, 1", {"[ADDRESS#1]": "Адреса: м. Київ, вул. Хрещатик, 1"}),
+        ("дата народження: 01.01.1990", {"[DOB#1]": "дата народження: 01.01.1990"}),
+        ("write to Test.User@Example.com", {"[EMAIL#1]": "Test.User@Example.com"}),
+        ("tel +38(093)123-45-67", {"[PHONE#1]": "+38(093)123-45-67"}),
+        ("адреса без двокрапки Київ", {}),
+        ("mail at example dot com", {}),
+    ],
+    ids=[
+        "address-label",
+        "dob-label-lowercase",
+        "email-mixed-case",
+        "phone-formatted",
+        "address-without-colon",
+        "email-without-at",
+    ],
+)
+def test_sanitize_typed_raw_detectors(text, expected_tags):
+    """Test raw-text detectors, including texts their prefilters skip."""
+    assert sanitize_typed(text)["tags"] == expected_tags
+
+
+def test_sanitize_typed_ignores_iban_like_noise():
+    """Test long UA-prefixed noise is not tagged as IBAN."""
+    res = sanitize_typed("UA" * 5000)
+    assert not any(t.startswith("[IBAN#") for t in res["tags"])
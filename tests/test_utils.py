@@ -1,19 +1,63 @@
 """Shared test utilities and fixtures."""
-from unittest.mock import patch, MagicMock
+from dataclasses import dataclass, field
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
 from backend.api.http.server import app
 
 
-def create_mock_chat_response():
-    """Create a mock response for chat_with_tools."""
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.role = "assistant"
-    mock_response.choices[0].message.content = "Mock response"
-    mock_response.choices[0].message.tool_calls = []
-    return mock_response
+@dataclass(slots=True)
+class FakeFunction:
+    """Function part of a fake LLM tool call."""
+
+    name: str
+    arguments: str
+
+
+@dataclass(slots=True)
+class FakeToolCall:
+    """Plain stand-in for an LLM tool call (instead of a MagicMock tree)."""
+
+    id: str
+    function: FakeFunction
+    type: str = "function"
+
+    def model_dump(self) -> dict:
+        """Mirror the pydantic dump the chat loop stores in history."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "function": {"name": self.function.name, "arguments": self.function.arguments},
+        }
+
+
+@dataclass(slots=True)
+class FakeMessage:
+    """Assistant message of a fake chat completion."""
+
+    role: str = "assistant"
+    content: str | None = "Mock response"
+    tool_calls: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class FakeChoice:
+    """Single choice of a fake chat completion."""
+
+    message: FakeMessage = field(default_factory=FakeMessage)
+
+
+@dataclass(slots=True)
+class FakeChatResponse:
+    """Plain stand-in for a chat_with_tools response (instead of a MagicMock tree)."""
+
+    choices: list = field(default_factory=lambda: [FakeChoice()])
+
+
+def create_mock_chat_response() -> FakeChatResponse:
+    """Create a mock response for chat_with_tools (fresh object: tests mutate it)."""
+    return FakeChatResponse()
 
 
 def setup_mock_chat():
@@ -1,26 +1,28 @@
 """Verification tests for PII persistence, role upsert, and contract API flow."""
 import json
-import os
 import sys
-from unittest.mock import MagicMock
 
-# Add project root to path
-sys.path.append(os.getcwd())
+import pytest
 
-from backend.api.http.state import conversation_store  # pylint: disable=wrong-import-position
-from backend.infra.persistence.store import load_session, save_session  # pylint: disable=wrong-import-position
-from tests.test_utils import (  # pylint: disable=wrong-import-position
-    setup_mock_chat,
+from backend.api.http.state import conversation_store
+from backend.infra.persistence.store import load_session, save_session
+from tests.test_utils import (
+    FakeFunction,
+    FakeToolCall,
     create_mock_chat_response,
+    setup_mock_chat,
 )
 
-patcher, mock_chat, client = setup_mock_chat()
-mock_response = create_mock_chat_response()
-mock_chat.return_value = mock_response
+pytestmark = pytest.mark.usefixtures("memory_session_store")
+
 USER_ID = "plan_user"
 
-def test_pii_persistence() -> None:
+
+def test_pii_persistence(api_client) -> None:
     """Test PII persistence and unmasking in conversation tags."""
+    client, mock_chat = api_client
+    mock_response = create_mock_chat_response()
+    mock_chat.return_value = mock_response
     print("\n--- Testing PII Persistence ---")
     # 1. Create session
     resp = client.post("/sessions", json={}, headers={"X-User-ID": USER_ID})
@@ -73,17 +75,21 @@ def test_pii_persistence() -> None:
     )
 
     # Mock LLM to call upsert_field with the tag
-    mock_tool_call = MagicMock()
-    mock_tool_call.id = "call_123"
-    mock_tool_call.function.name = "upsert_field"
-    mock_tool_call.function.arguments = json.dumps({
-        "field": "id_code", # Using id_code just for test, though it expects digits usually. 
-                            # But upsert_field unmasks BEFORE validation.
-                            # If validation fails, it's fine, as long as we see unmasking happened.
-                            # But better to use a field that accepts text or match the type.
-                            # IBAN is usually for bank details.
-        "value": iban_tag
-    })
+    mock_tool_call = FakeToolCall(
+        id="call_123",
+        function=FakeFunction(
+            name="upsert_field",
+            arguments=json.dumps({
+                # Using id_code just for test, though it expects digits usually.
+                # But upsert_field unmasks BEFORE validation.
+                # If validation fails, it's fine, as long as we see unmasking happened.
+                # But better to use a field that accepts text or match the type.
+                # IBAN is usually for bank details.
+                "field": "id_code",
+                "value": iban_tag
+            }),
+        ),
+    )
 
     mock_response.choices[0].message.tool_calls = [mock_tool_call]
 
@@ -126,8 +132,10 @@ def test_pii_persistence() -> None:
     mock_response.choices[0].message.tool_calls = []
 
 
-def test_explicit_role_upsert() -> None:
+def test_explicit_role_upsert(api_client) -> None:
     """Test explicit role upsert with different active role."""
+    client, mock_chat = api_client
+    mock_chat.return_value = create_mock_chat_response()
     print("\n--- Testing Explicit Role Upsert ---")
     # 1. Create session
     resp = client.post("/sessions", json={}, headers={"X-User-ID": USER_ID})
@@ -194,8 +202,10 @@ def test_explicit_role_upsert() -> None:
     print("Explicit role upsert verified successfully.")
 
 
-def test_contract_api_flow() -> None:
+def test_contract_api_flow(api_client) -> None:
     """Test contract API flow: create, preview, sign, download."""
+    client, mock_chat = api_client
+    mock_chat.return_value = create_mock_chat_response()
     print("\n--- Testing Contract API Flow ---")
     # 1. Setup Session
     resp = client.post("/sessions", json={}, headers={"X-User-ID": USER_ID})
@@ -313,13 +323,16 @@ def test_contract_api_flow() -> None:
     print("Contract API Flow: OK")
 
 if __name__ == "__main__":
+    patcher, chat_mock, test_client = setup_mock_chat()
     try:
-        test_pii_persistence()
-        test_explicit_role_upsert()
-        test_contract_api_flow()
+        test_pii_persistence((test_client, chat_mock))
+        test_explicit_role_upsert((test_client, chat_mock))
+        test_contract_api_flow((test_client, chat_mock))
         print("\nALL TESTS PASSED")
     except (RuntimeError, ValueError, AssertionError) as e:
         print(f"\nTEST FAILED: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        patcher.stop()
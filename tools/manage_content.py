@@ -1,15 +1,12 @@
 """Developer CLI for managing bot content (categories, templates, fields)."""
 import argparse
+import sys
+from functools import lru_cache
 
-from backend.domain.content.manager import ContentManager
-from backend.shared.logging import setup_logging
-
-
-def main() -> None:
-    """Main entry point for content management CLI."""
-    setup_logging()
-    manager = ContentManager()
 
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; repeated in-process main() calls reuse it."""
     parser = argparse.ArgumentParser(
         description="Developer CLI for managing bot content.",
     )
@@ -50,7 +47,24 @@ def main() -> None:
     field_parser.add_argument("--label", required=True, help="Field label")
     field_parser.add_argument("--required", action="store_true", help="Is field required?")
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for content management CLI; returns the exit code."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 0
+
+    # Backend imports only when there is work to do (keeps --help fast)
+    # pylint: disable=import-outside-toplevel
+    from backend.domain.content.manager import ContentManager
+    from backend.shared.logging import setup_logging
+
+    setup_logging()
+    manager = ContentManager()
 
     if args.command == "add-category":
         try:
@@ -58,6 +72,7 @@ def main() -> None:
             print(f"[OK] Category '{args.id}' created successfully.")
         except (OSError, ValueError, KeyError) as e:
             print(f"[ERROR] Error: {e}")
+            return 1
 
     elif args.command == "add-template":
         try:
@@ -65,6 +80,7 @@ def main() -> None:
             print(f"[OK] Template '{args.id}' added to category '{args.category}'.")
         except (OSError, ValueError, KeyError) as e:
             print(f"[ERROR] Error: {e}")
+            return 1
 
     elif args.command == "add-role":
         try:
@@ -81,6 +97,7 @@ def main() -> None:
             print(f"[OK] Role '{args.id}' added to category '{args.category}'.")
         except (OSError, ValueError, KeyError) as e:
             print(f"[ERROR] Error: {e}")
+            return 1
 
     elif args.command == "add-field":
         try:
@@ -88,10 +105,10 @@ def main() -> None:
             print(f"[OK] Field '{args.field}' added to category '{args.category}'.")
         except (OSError, ValueError, KeyError) as e:
             print(f"[ERROR] Error: {e}")
+            return 1
 
-    else:
-        parser.print_help()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -9,8 +9,11 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from backend.domain.sessions.models import Session, SessionState
 from backend.infra.config.settings import settings
@@ -35,35 +38,78 @@ def _load_session_stub(session_id: str, payload: dict) -> Session:
     )
 
 
+# Documents handed to the repository per bulk_create_or_update call
+BATCH_SIZE = 10_000
+# Threads reading JSON files; writes stay on the calling thread
+READ_WORKERS = 16
+
+
+def _read_document(path: Path) -> tuple[Path, Any, Exception | None]:
+    try:
+        return path, read_json(path), None
+    except (OSError, ValueError, KeyError) as exc:
+        return path, None, exc
+
+
+def _flush(repo, batch: list[tuple[Session, dict]]) -> int:
+    """Write one batch; on failure retry row by row so one bad document is isolated."""
+    try:
+        repo.bulk_create_or_update(batch)
+    except (OSError, ValueError, RuntimeError) as exc:
+        logger.warning("Batch write failed (%s), retrying %s row(s) one by one", exc, len(batch))
+    else:
+        for session, _ in batch:
+            logger.info("Migrated session_id=%s", session.session_id)
+        return len(batch)
+
+    migrated = 0
+    for session, payload in batch:
+        try:
+            repo.create_or_update(session, payload)
+            migrated += 1
+            logger.info("Migrated session_id=%s", session.session_id)
+        except (OSError, ValueError, RuntimeError) as exc:
+            logger.error("Failed to migrate %s: %s", session.session_id, exc)
+    return migrated
+
+
 def migrate(root: Path, dry_run: bool = False) -> None:
     """Migrate user-documents from filesystem to contracts repository."""
     repo = get_contracts_repo()
-    files = sorted(root.glob("*.json"))
+    with os.scandir(root) as it:
+        names = sorted(e.name for e in it if e.name.endswith(".json") and e.is_file())
+    files = [root / name for name in names]
     if not files:
         logger.info("No JSON user-documents found under %s", root)
         return
 
     migrated = 0
-    for path in files:
-        session_id = path.stem
-        try:
-            payload = read_json(path)
-        except (OSError, ValueError, KeyError) as exc:
-            logger.error("Failed to read %s: %s", path, exc)
-            continue
-
-        session = _load_session_stub(session_id, payload)
-        if dry_run:
-            logger.info("DRY-RUN would migrate session_id=%s", session_id)
-            migrated += 1
-            continue
-
-        try:
-            repo.create_or_update(session, payload)
-            migrated += 1
-            logger.info("Migrated session_id=%s", session_id)
-        except (OSError, ValueError, RuntimeError) as exc:
-            logger.error("Failed to migrate %s: %s", session_id, exc)
+    batch: list[tuple[Session, dict]] = []
+    # One repository connection for the whole run (dry-run never touches the repository)
+    writes = nullcontext() if dry_run else repo.bulk_context()
+    # Reads overlap in the pool; one slice of files at a time keeps memory bounded
+    with writes, ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        for start in range(0, len(files), BATCH_SIZE):
+            chunk = files[start : start + BATCH_SIZE]
+            for path, payload, error in pool.map(_read_document, chunk):
+                if error is not None:
+                    logger.error("Failed to read %s: %s", path, error)
+                    continue
+
+                session_id = path.stem
+                session = _load_session_stub(session_id, payload)
+                if dry_run:
+                    logger.info("DRY-RUN would migrate session_id=%s", session_id)
+                    migrated += 1
+                    continue
+
+                batch.append((session, payload))
+                if len(batch) >= BATCH_SIZE:
+                    migrated += _flush(repo, batch)
+                    batch = []
+
+        if batch:
+            migrated += _flush(repo, batch)
 
     logger.info("Migration finished: %s document(s) processed", migrated)
 
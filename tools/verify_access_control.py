@@ -1,13 +1,9 @@
 """Verification script for session access control logic."""
-import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi.testclient import TestClient
 
-# Add src to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
-
-from backend.api.http.server import app  # pylint: disable=wrong-import-position
+from backend.api.http.server import app
 
 client = TestClient(app)
 
@@ -90,11 +86,22 @@ def test_access_control() -> None:
     )
     assert resp.status_code == 200
 
+    # 5-7 are independent read-only probes: send them concurrently, report in order
+    user3_id = "user_3"
+    probes = [
+        (f"/sessions/{session_id}", user3_id),
+        (f"/sessions/{session_id}/schema", user3_id),
+        (f"/sessions/{session_id}", user1_id),
+    ]
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        user3_session, user3_schema, user1_session = pool.map(
+            lambda probe: client.get(probe[0], headers={"X-User-ID": probe[1]}), probes
+        )
+
     # 5. User 3 tries to access session (GET /sessions/{id})
     # Session should be full now (assuming 2 roles).
-    user3_id = "user_3"
     print("User 3 trying to access session (should be BLOCKED)...")
-    resp = client.get(f"/sessions/{session_id}", headers={"X-User-ID": user3_id})
+    resp = user3_session
 
     if resp.status_code == 403:
         print("SUCCESS: User 3 blocked with 403.")
@@ -103,7 +110,7 @@ def test_access_control() -> None:
 
     # 6. User 3 tries to get schema
     print("User 3 trying to get schema (should be BLOCKED)...")
-    resp = client.get(f"/sessions/{session_id}/schema", headers={"X-User-ID": user3_id})
+    resp = user3_schema
     if resp.status_code == 403:
         print("SUCCESS: User 3 blocked from schema with 403.")
     else:
@@ -111,7 +118,7 @@ def test_access_control() -> None:
 
     # 7. User 1 accesses session (should be ALLOWED)
     print("User 1 accessing session (should be ALLOWED)...")
-    resp = client.get(f"/sessions/{session_id}", headers={"X-User-ID": user1_id})
+    resp = user1_session
     if resp.status_code == 200:
         print("SUCCESS: User 1 allowed.")
     else:
@@ -137,7 +144,9 @@ def test_access_control() -> None:
 
 if __name__ == "__main__":
     try:
-        test_access_control()
+        # One portal/event loop for every request; probes share it across threads
+        with client:
+            test_access_control()
     except (RuntimeError, ValueError, AssertionError) as e:
         print(f"Test failed with exception: {e}")
         import traceback
@@ -1,16 +1,22 @@
 """Verification script for session concurrency handling."""
+import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 
+from backend.infra.config.settings import settings
 from backend.infra.persistence.store import get_or_create_session, load_session
 
+# Give up the CPU without a fixed sleep; time.sleep(0) where sched_yield is unavailable
+_yield = getattr(os, "sched_yield", None) or (lambda: time.sleep(0))
+
 
 def worker(session_id: str, user_id: str) -> str:
     """Worker function that attempts to get or create a session."""
     try:
-        print(f"[{user_id}] Starting...")
-        # Simulate slight delay to increase race chance
-        time.sleep(0.01)
+        print(f"[{user_id}] Starting on {threading.current_thread().name}...")
+        # Force a context switch so threads interleave before the race
+        _yield()
         session = get_or_create_session(session_id, creator_user_id=user_id)
         print(f"[{user_id}] Done. Got session creator: {session.creator_user_id}")
         return session.creator_user_id
@@ -27,12 +33,12 @@ def test_concurrency() -> None:
 
     print(f"Launching {num_threads} threads for session {session_id}...")
 
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = [
-            executor.submit(worker, session_id, f"user_{i}")
-            for i in range(num_threads)
-        ]
-        results = [f.result() for f in futures]
+    with ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix="verify-conc") as executor:
+        results = list(executor.map(
+            worker,
+            [session_id] * num_threads,
+            [f"user_{i}" for i in range(num_threads)],
+        ))
 
     print(f"Results: {results}")
 
@@ -64,4 +70,8 @@ def test_concurrency() -> None:
         print(f"❌ Failed to load session: {e}")
 
 if __name__ == "__main__":
+    # Race the in-memory store unless a backend is chosen explicitly,
+    # so the run exercises locking rather than Redis/network latency
+    if not os.getenv("SESSION_BACKEND"):
+        settings.session_backend = "memory"
     test_concurrency()
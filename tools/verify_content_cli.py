@@ -1,20 +1,26 @@
 """Verification script for content management CLI."""
-import json
-import subprocess
-import sys
+import io
+from contextlib import redirect_stderr, redirect_stdout
 
+from tools import manage_content
 from backend.infra.config.settings import settings
+from backend.infra.storage.fs import read_json, write_json
 
 
 def run_command(args: list[str]) -> bool:
-    """Run manage_content.py with given arguments."""
-    cmd = [sys.executable, "manage_content.py"] + args
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    print(f"CMD: {' '.join(cmd)}")
-    print(f"STDOUT: {result.stdout.strip()}")
-    if result.stderr:
-        print(f"STDERR: {result.stderr.strip()}")
-    return result.returncode == 0
+    """Run the manage_content.py CLI in-process with given arguments."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    # In-process call instead of a subprocess: no interpreter start-up per step
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            code = manage_content.main(args)
+        except SystemExit as exc:  # argparse usage errors
+            code = exc.code
+    print(f"CMD: manage_content.py {' '.join(args)}")
+    print(f"STDOUT: {stdout.getvalue().strip()}")
+    if stderr.getvalue():
+        print(f"STDERR: {stderr.getvalue().strip()}")
+    return code == 0
 
 def verify() -> None:
     """Verify content management CLI functionality."""
@@ -46,12 +52,11 @@ def verify() -> None:
         "--id", "test_tmpl", "--name", "Test Template",
     ]
     if run_command(add_tmpl_args):
-        with cat_file.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if any(t["id"] == "test_tmpl" for t in data.get("templates", [])):
-                print("[OK] Template added to JSON.")
-            else:
-                print("[ERROR] Template NOT found in JSON.")
+        data = read_json(cat_file)
+        if any(t["id"] == "test_tmpl" for t in data.get("templates", [])):
+            print("[OK] Template added to JSON.")
+        else:
+            print("[ERROR] Template NOT found in JSON.")
     else:
         print("[ERROR] Command failed.")
 
@@ -62,12 +67,11 @@ def verify() -> None:
         "--field", "test_field", "--label", "Test Label", "--required",
     ]
     if run_command(add_field_args):
-        with cat_file.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if any(f["field"] == "test_field" for f in data.get("contract_fields", [])):
-                print("[OK] Field added to JSON.")
-            else:
-                print("[ERROR] Field NOT found in JSON.")
+        data = read_json(cat_file)
+        if any(f["field"] == "test_field" for f in data.get("contract_fields", [])):
+            print("[OK] Field added to JSON.")
+        else:
+            print("[ERROR] Field NOT found in JSON.")
     else:
         print("[ERROR] Command failed.")
 
@@ -75,11 +79,9 @@ def verify() -> None:
     print("\n--- Cleanup ---")
     # Remove from index
     if index_path.exists():
-        with index_path.open("r", encoding="utf-8") as f:
-            idx_data = json.load(f)
+        idx_data = read_json(index_path)
         idx_data["categories"] = [c for c in idx_data["categories"] if c["id"] != test_cat_id]
-        with index_path.open("w", encoding="utf-8") as f:
-            json.dump(idx_data, f, indent=2, ensure_ascii=False)
+        write_json(index_path, idx_data)
         print("Cleaned index.")
 
     # Remove file
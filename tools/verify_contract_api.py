@@ -1,12 +1,6 @@
 """Verification script for contract API functionality."""
-import os
-import sys
-
-# Add project root to path
-sys.path.append(os.getcwd())
-
-from backend.infra.persistence.store import load_session  # pylint: disable=wrong-import-position
-from tests.test_utils import setup_mock_chat  # pylint: disable=wrong-import-position
+from backend.infra.persistence.store import load_session
+from tests.test_utils import setup_mock_chat
 
 patcher, mock_chat, client = setup_mock_chat()
 
@@ -110,21 +104,18 @@ def test_contract_api() -> None:
                     "id_doc": "CD654321"
                 }
             }
+        },
+        # Remaining contract fields go in the same call
+        "contract_fields": {
+            "object_address": "Kyiv, Main St, 1",
+            "rent_price_month": "10000",
+            "start_date": "01.01.2025"
         }
     }
 
     resp = client.post(f"/sessions/{session_id}/sync", json=sync_data)
     assert resp.status_code == 200, f"Sync failed: {resp.text}"
 
-    # Upsert remaining contract fields
-    contract_fields = {
-        "object_address": "Kyiv, Main St, 1",
-        "rent_price_month": "10000",
-        "start_date": "01.01.2025"
-    }
-    for f, v in contract_fields.items():
-        client.post(f"/sessions/{session_id}/fields", json={"field": f, "value": v})
-
     # 3. Check Contract Info
     resp = client.get(f"/sessions/{session_id}/contract")
     print("Contract Info:", resp.json())
@@ -168,5 +159,8 @@ def test_contract_api() -> None:
     assert resp.status_code == 200
 
 if __name__ == "__main__":
-    test_pii_persistence()
-    test_contract_api()
+    # One portal/event loop for every request instead of one per call
+    with client:
+        test_pii_persistence()
+        test_contract_api()
+    patcher.stop()
@@ -1,6 +1,12 @@
 """Verification script for multi-user session support."""
+import asyncio
+
 from backend.infra.persistence.store import get_or_create_session, load_session
-from backend.agent.tools.session import SetPartyContextTool, UpsertFieldTool
+from backend.agent.tools.session import SetPartyContextTool, UpsertFieldsBatchTool
+
+# Tools require an acting user; the creator in FULL mode may prefill both parties
+CREATOR_ID = "multi_user_creator"
+CONTEXT = {"user_id": CREATOR_ID}
 
 
 def verify_multi_user() -> None:
@@ -14,49 +20,43 @@ def verify_multi_user() -> None:
     session = get_or_create_session(session_id)
     # Assuming this category exists from previous steps or default
     session.category_id = "lease_real_estate"
-    session.save_session = lambda: None  # Mock save for now? No, we need real save.
+    session.creator_user_id = CREATOR_ID
+    session.filling_mode = "full"
     # We rely on real store
     from backend.infra.persistence.store import save_session  # pylint: disable=import-outside-toplevel
     save_session(session)
 
     # Tools
     set_party_tool = SetPartyContextTool()
-    upsert_tool = UpsertFieldTool()
+    upsert_batch_tool = UpsertFieldsBatchTool()
 
     # 2. Set Context for Lessor (Individual)
     print("\n2. Setting context: Lessor (Individual)...")
-    res = set_party_tool.execute({
+    res = asyncio.run(set_party_tool.execute({
         "session_id": session_id,
         "role": "lessor",
         "person_type": "individual"
-    }, {})
-    print(f"Result: {res}")
-
-    # 3. Fill Lessor Name
-    print("\n3. Filling Lessor Name -> 'Ivan Lessor'...")
-    res = upsert_tool.execute({
-        "session_id": session_id,
-        "field": "name",
-        "value": "Ivan Lessor"
-    }, {})
+    }, CONTEXT))
     print(f"Result: {res}")
 
-    # 4. Set Context for Lessee (Company)
-    print("\n4. Setting context: Lessee (Company)...")
-    res = set_party_tool.execute({
+    # 3. Set Context for Lessee (Company)
+    print("\n3. Setting context: Lessee (Company)...")
+    res = asyncio.run(set_party_tool.execute({
         "session_id": session_id,
         "role": "lessee",
         "person_type": "company"
-    }, {})
+    }, CONTEXT))
     print(f"Result: {res}")
 
-    # 5. Fill Lessee Name (Same field name 'name', but different role)
-    print("\n5. Filling Lessee Name -> 'Mega Corp'...")
-    res = upsert_tool.execute({
+    # 4-5. Fill both names (same field name 'name', different roles) in one batch / one save
+    print("\n4-5. Filling Lessor Name -> 'Ivan Lessor', Lessee Name -> 'Mega Corp'...")
+    res = asyncio.run(upsert_batch_tool.execute({
         "session_id": session_id,
-        "field": "name",
-        "value": "Mega Corp"
-    }, {})
+        "updates": [
+            {"role": "lessor", "field": "name", "value": "Ivan Lessor"},
+            {"role": "lessee", "field": "name", "value": "Mega Corp"},
+        ],
+    }, CONTEXT))
     print(f"Result: {res}")
 
     # 6. Verify Data Separation
@@ -1,19 +1,14 @@
 """Verification script for refactored session and category logic."""
-import os
 import sys
 
-# Add project root to path
-sys.path.append(os.getcwd())
-
-from backend.domain.sessions.models import Session, SessionState  # pylint: disable=wrong-import-position
-from backend.domain.sessions.actions import set_session_category  # pylint: disable=wrong-import-position
-from backend.agent.tools.session import UpsertFieldTool  # pylint: disable=wrong-import-position
-from backend.domain.validation.core import validate_value  # pylint: disable=wrong-import-position
+from backend.domain.categories.index import store
+from backend.domain.sessions.models import Session, SessionState
+from backend.domain.sessions.actions import set_session_category
+from backend.domain.validation.core import validate_value
 
 
 def test_set_session_category() -> None:
     """Test set_session_category function with known and unknown categories."""
-    # pylint: disable=import-outside-toplevel
     print("Testing set_session_category...")
     session = Session(session_id="test_session_cat")
     # Mock category store or assume 'lease_flat' exists (it should in this project)
@@ -25,13 +20,12 @@ def test_set_session_category() -> None:
 
     # Try known (assuming lease_flat exists as per previous context)
     # If not sure, we can list categories first, but let's try.
-    from backend.domain.categories.index import store
-    store.load()
+    # store.categories loads the index lazily, once per process
     if not store.categories:
         print("Skipping positive test for set_session_category (no categories found)")
         return
 
-    cat_id = list(store.categories.keys())[0]
+    cat_id = next(iter(store.categories))
     ok = set_session_category(session, cat_id)
     assert ok, f"Should succeed for known category {cat_id}"
     assert session.category_id == cat_id
@@ -41,16 +35,17 @@ def test_set_session_category() -> None:
 def test_upsert_field_validation() -> None:
     """Test UpsertFieldTool validation with RNOKPP field."""
     # pylint: disable=import-outside-toplevel,unused-variable
+    # The agent tool module pulls in the docx/LLM stack; load it only for this check
+    from backend.agent.tools.session import UpsertFieldTool
+
     print("Testing UpsertFieldTool validation...")
     # We need a session with a category
     session = Session(session_id="test_session_val")
-    from backend.domain.categories.index import store
-    store.load()
     if not store.categories:
         print("Skipping validation test (no categories)")
         return
 
-    cat_id = list(store.categories.keys())[0]
+    cat_id = next(iter(store.categories))
     set_session_category(session, cat_id)
 
     # Mock context
@@ -88,9 +83,9 @@ def test_upsert_field_validation() -> None:
     _, err = validate_value("rnokpp", "123")
     assert err is not None, "Should fail invalid RNOKPP"
 
-    # 10 digits but invalid checksum likely
+    # Any 10 digits pass: normalize_rnokpp deliberately skips the checksum
     _, err = validate_value("rnokpp", "1234567890")
-    assert err is not None, "Should fail invalid checksum RNOKPP"
+    assert err is None, "Should accept 10-digit RNOKPP"
 
     print("Validation registry passed.")
 
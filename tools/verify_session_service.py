@@ -1,29 +1,53 @@
 """Verification script for session service functions."""
-import os
-import sys
+import re
 
-# Add project root to path
-sys.path.append(os.getcwd())
-
-# pylint: disable=wrong-import-position
 from backend.domain.sessions.models import Session, SessionState
-from backend.domain.services.session import update_session_field
-from backend.domain.categories.index import store as category_store
-
-# Mock category store for testing if needed, or use real one if available
-# Assuming we have some categories loaded. If not, we might need to mock.
-# Let's check if we can load real categories.
-category_store.load()
-if not category_store.categories:
-    print("WARNING: No categories found. Verification might fail if it depends on real categories.")
-    # We might need to mock list_entities/list_party_fields if no real data
-else:
-    print(f"Loaded {len(category_store.categories)} categories.")
+from backend.domain.services.fields import (
+    collect_missing_fields,
+    get_required_fields,
+    validate_session_readiness,
+)
+from backend.domain.services.session import (
+    set_party_type,
+    set_session_template,
+    update_session_field,
+    update_session_fields,
+)
+from backend.domain.categories.index import list_party_fields, store as category_store
+
+# Dummy values for required fields, picked by the kind found in the field key
+_KIND_RE = re.compile(r"(date|email|iban|rnokpp)")
+_DEFAULTS = {
+    "date": "01.01.2025",
+    "email": "test@example.com",
+    "iban": "UA" + "0" * 27,  # Valid-ish IBAN length
+    "rnokpp": "1234567890",
+}
+
+_categories_loaded = False  # pylint: disable=invalid-name
+
+
+def _ensure_loaded() -> None:
+    """Load the category store once, on first use rather than at import."""
+    global _categories_loaded  # pylint: disable=global-statement
+    if _categories_loaded:
+        return
+    category_store.load()
+    _categories_loaded = True
+    if not category_store.categories:
+        print(
+            "WARNING: No categories found. "
+            "Verification might fail if it depends on real categories."
+        )
+    else:
+        print(f"Loaded {len(category_store.categories)} categories.")
+
 
 def test_update_session_field() -> None:
     """Test update_session_field and related session service functions."""
-    # pylint: disable=import-outside-toplevel,too-many-statements,too-many-locals
+    # pylint: disable=too-many-statements,too-many-locals
     print("\n--- Testing update_session_field ---")
+    _ensure_loaded()
 
     # 1. Setup Session
     session = Session(session_id="test_session")
@@ -42,7 +66,6 @@ def test_update_session_field() -> None:
 
     # 2. Test Valid Update (Party Field)
     # Find a valid field name
-    from backend.domain.categories.index import list_party_fields
     fields = list_party_fields(cat_id, "individual")
     if not fields:
         print("No fields for individual in this category.")
@@ -87,7 +110,6 @@ def test_update_session_field() -> None:
 
     # 5. Test State Cleanup (Person Type Change)
     print("Testing state cleanup on person type change...")
-    from backend.domain.services.session import set_party_type
 
     # Currently lessor is individual, and we have fields set
     assert f"lessor.{field_name}" in session.all_data
@@ -106,7 +128,6 @@ def test_update_session_field() -> None:
 
     # 6. Test Filling Mode (Partial vs Full)
     print("Testing filling mode logic...")
-    from backend.domain.services.fields import validate_session_readiness
 
     # Reset session fields
     session.party_fields = {}
@@ -130,49 +151,33 @@ def test_update_session_field() -> None:
 
     # We need to fill ALL required fields for the current role + contract fields
     # to be ready in partial mode.
-    from backend.domain.services.fields import get_required_fields
     reqs = get_required_fields(session)
 
     print(f"Filling {len(reqs)} required fields for partial mode...")
+    updates = []
     for r in reqs:
         # Fill with dummy value
-        val = "Dummy Value"
-        if "date" in r.key:
-            val = "01.01.2025"
-        elif "email" in r.key:
-            val = "test@example.com"
-        elif "iban" in r.key:
-            val = "UA" + "0" * 27  # Valid-ish IBAN length
-        elif "rnokpp" in r.key:
-            val = "1234567890"
-
+        m = _KIND_RE.search(r.key)
+        val = _DEFAULTS[m.group(1)] if m else "Dummy Value"
         # We need to pass role if it's a party field
-        update_session_field(session, r.field_name, val, role=r.role)
+        updates.append((r.role, r.field_name, val))
+    # One readiness/progress pass for the whole batch
+    update_session_fields(session, updates)
 
     is_ready = validate_session_readiness(session)
     if is_ready:
         print("✅ Partial mode validation successful (Ready with only one side)")
     else:
         print("❌ Partial mode validation failed (Not ready)")
-        # Debug
-        reqs_still = get_required_fields(session)
-        # Check which ones are not ok
-        missing = []
-        for r in reqs_still:
-            if r.role:
-                st = session.party_fields.get(r.role, {}).get(r.field_name)
-            else:
-                st = session.contract_fields.get(r.field_name)
-
-            if not st or st.status != "ok":
-                missing.append(r.key)
-        print("Missing:", missing)
-
+        # Debug: readiness checks every role, so report the "all" scope
+        report = collect_missing_fields(session, scope="all")["missing_all"]
+        missing = [f["key"] for f in report["contract"]]
+        for fields in report["roles"].values():
+            missing.extend(f["key"] for f in fields)
         print("Missing:", missing)
 
     # 7. Test set_session_template
     print("\n--- Testing set_session_template ---")
-    from backend.domain.services.session import set_session_template
 
     # Mock template_id
     new_template_id = "test_template_123"
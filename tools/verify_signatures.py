@@ -1,6 +1,10 @@
 """Verification script for contract signature logic."""
+import os
+
 from backend.domain.sessions.models import Session, SessionState
 from backend.domain.services.session import update_session_field
+from backend.infra.config.settings import settings
+from backend.infra.persistence import contracts_repository
 
 
 def test_signature_logic() -> None:
@@ -8,7 +12,7 @@ def test_signature_logic() -> None:
     # pylint: disable=import-outside-toplevel
     print("--- Testing Signature Logic ---")
 
-    from backend.infra.persistence.store import save_session
+    from backend.infra.persistence.store import save_session, transactional_session
 
     # Setup Session
     session = Session(
@@ -21,22 +25,17 @@ def test_signature_logic() -> None:
     )
     save_session(session)
 
-    # 1. Fill some data
+    # 1. Fill some data and move to BUILT (signing requires it) in one save
     print("Filling initial data...")
-    update_session_field(session, "name", "Lessor Name", role="lessor")
-    save_session(session)
+    with transactional_session(session.session_id) as session:
+        update_session_field(session, "name", "Lessor Name", role="lessor")
+        session.state = SessionState.BUILT
 
     # 2. Sign as Lessor using Tool
     print("Signing as Lessor...")
-    # Need to mock tool execution or call logic directly?
-    # Let's call the logic directly via a helper or just simulate what tool does.
     # Since we want to verify the TOOL logic, we should import it.
     from backend.agent.tools.session import SignContractTool
 
-    # We need to be in BUILT state to sign
-    session.state = SessionState.BUILT
-    save_session(session)
-
     tool = SignContractTool()
     res = tool.execute({"session_id": session.session_id, "role": "lessor"}, {})
 
@@ -78,6 +77,14 @@ def test_signature_logic() -> None:
         print(f"❌ Edit failed for lessee! err={err}")
 
 if __name__ == "__main__":
+    # Keep sessions and their user documents in memory unless a session
+    # backend is chosen explicitly: the checks don't need anything persisted
+    if not os.getenv("SESSION_BACKEND"):
+        settings.session_backend = "memory"
+        # pylint: disable-next=protected-access
+        contracts_repository._repo_state.instance = (
+            contracts_repository.InMemoryContractsRepository()
+        )
     try:
         test_signature_logic()
         print("\nAll signature tests passed!")
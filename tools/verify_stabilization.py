@@ -1,8 +1,11 @@
 """Verification script for file locking and validation stabilization."""
+import os
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 from backend.infra.storage.fs import write_json
 from backend.agent.tools.session import UpsertFieldTool
+from backend.infra.config.settings import settings
+from backend.infra.persistence import contracts_repository
 
 # Setup test paths
 TEST_DIR = Path("test_data")
@@ -114,6 +117,14 @@ def test_validation() -> None:
 
 
 if __name__ == "__main__":
+    # Keep sessions and their user documents in memory unless a session
+    # backend is chosen explicitly: the checks don't need anything persisted
+    if not os.getenv("SESSION_BACKEND"):
+        settings.session_backend = "memory"
+        # pylint: disable-next=protected-access
+        contracts_repository._repo_state.instance = (
+            contracts_repository.InMemoryContractsRepository()
+        )
     try:
         test_file_locking()
         test_validation()